@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 from src.database import Base
-from src.models import Lead, TechStack, ScrapingJob
+from src.models import Lead, TechStack, ScrapingJob, ScrapingJobUnit
 from src.config import get_settings
 
 config = context.config
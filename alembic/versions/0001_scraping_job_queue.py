@@ -0,0 +1,48 @@
+"""scraping job queue
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:59:00.000000
+
+Brings databases created by init_db before the job queue up to date.
+init_db's create_all never adds columns to existing tables. A database
+created from the current models already has everything; run
+`alembic stamp head` there instead of upgrading.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Job parameters, so a worker can run the job
+    op.add_column("scraping_jobs", sa.Column("keywords", sa.JSON(), nullable=True))
+    op.add_column("scraping_jobs", sa.Column("limit_per_keyword", sa.Integer(), server_default="20", nullable=False))
+    op.add_column("scraping_jobs", sa.Column("tiled", sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_index(op.f("ix_scraping_jobs_status"), "scraping_jobs", ["status"], unique=False)
+
+    # Queue lease
+    op.add_column("scraping_jobs", sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("scraping_jobs", sa.Column("locked_by", sa.String(length=100), nullable=True))
+    op.add_column("scraping_jobs", sa.Column("locked_until", sa.DateTime(), nullable=True))
+    op.add_column("scraping_jobs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("scraping_jobs", "heartbeat_at")
+    op.drop_column("scraping_jobs", "locked_until")
+    op.drop_column("scraping_jobs", "locked_by")
+    op.drop_column("scraping_jobs", "attempts")
+    op.drop_index(op.f("ix_scraping_jobs_status"), table_name="scraping_jobs")
+    op.drop_column("scraping_jobs", "tiled")
+    op.drop_column("scraping_jobs", "limit_per_keyword")
+    op.drop_column("scraping_jobs", "keywords")
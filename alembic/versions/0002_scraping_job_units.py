@@ -0,0 +1,46 @@
+"""scraping job units
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Progress
+    op.add_column("scraping_jobs", sa.Column("units_total", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("scraping_jobs", sa.Column("units_done", sa.Integer(), server_default="0", nullable=False))
+
+    op.create_table(
+        "scraping_job_units",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("keyword", sa.String(length=100), nullable=False),
+        sa.Column("unit", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("leads_found", sa.Integer(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["scraping_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "keyword", "unit"),
+    )
+    op.create_index(op.f("ix_scraping_job_units_job_id"), "scraping_job_units", ["job_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_scraping_job_units_job_id"), table_name="scraping_job_units")
+    op.drop_table("scraping_job_units")
+    op.drop_column("scraping_jobs", "units_done")
+    op.drop_column("scraping_jobs", "units_total")
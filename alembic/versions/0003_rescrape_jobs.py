@@ -0,0 +1,28 @@
+"""rescrape jobs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 01:01:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("scraping_jobs", sa.Column("rescrape", sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column("scraping_jobs", sa.Column("change_summary", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("scraping_jobs", "change_summary")
+    op.drop_column("scraping_jobs", "rescrape")
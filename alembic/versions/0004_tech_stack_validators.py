@@ -0,0 +1,31 @@
+"""tech stack page validators
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 01:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cache validators of the analyzed page
+    op.add_column("tech_stacks", sa.Column("etag", sa.String(length=255), nullable=True))
+    op.add_column("tech_stacks", sa.Column("last_modified", sa.String(length=100), nullable=True))
+    op.add_column("tech_stacks", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tech_stacks", "content_hash")
+    op.drop_column("tech_stacks", "last_modified")
+    op.drop_column("tech_stacks", "etag")
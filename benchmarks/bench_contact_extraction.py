@@ -0,0 +1,64 @@
+"""
+CPU cost of contact extraction (emails, phones, tel: and WhatsApp links).
+
+Compares the single-pass ContactValidator.scan_html against running each
+pattern separately with re.findall, as extraction used to, on synthetic
+agency pages with contacts in the listings and footer.
+
+Usage:
+    python -m benchmarks.bench_contact_extraction [--size-kb 500] [--pages 20] [--repeat 5]
+"""
+import argparse
+import re
+
+from benchmarks.bench_html_parsers import bench, make_page
+from src.validators.contact import ContactValidator
+
+FOOTER = (
+    '<footer><p>Av. Santa Fe 1234, CABA - Tel: (11) 4567-8901 / 15 1234-5678</p>'
+    '<a href="tel:+54 9 11 4444 5555">Llamanos</a> <a href="mailto:info@inmobiliaria.com.ar">info@inmobiliaria.com.ar</a>'
+    '<a href="https://wa.me/5491122223333" class="btn-whatsapp">WhatsApp</a>'
+    '<a href="https://api.whatsapp.com/send?phone=5491133334444">Chat</a></footer>'
+)
+
+
+def make_agency_page(size_kb: int, seed: int) -> str:
+    """Listing page with an agent contact every few cards and a contact footer"""
+    html = make_page(size_kb, seed)
+    cards = html.split('<div class="card')
+    for i in range(1, len(cards), 7):
+        cards[i] += f"<p>Agente: agente{i}@inmobiliaria.com.ar - Cel: 11 5{i % 10}00-{1000 + i}</p>"
+    return '<div class="card'.join(cards).replace("</body>", FOOTER + "</body>")
+
+
+def separate_passes(html: str) -> None:
+    """One re.findall per pattern, the way extraction used to scan a page"""
+    re.findall(ContactValidator.EMAIL_PATTERN, html, re.IGNORECASE)
+    for pattern in ContactValidator.PHONE_PATTERNS:
+        re.findall(pattern, html)
+    re.findall(r'href=["\']tel:([^"\']+)["\']', html, re.IGNORECASE)
+    re.findall(r"wa\.me/(\d+)", html)
+    re.findall(r"api\.whatsapp\.com/send\?phone=(\d+)", html)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-kb", type=int, default=500)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = [make_agency_page(args.size_kb, seed) for seed in range(args.pages)]
+    print(f"{len(pages)} pages of ~{args.size_kb} KB")
+
+    old = bench(lambda: [separate_passes(html) for html in pages], args.repeat)
+    new = bench(lambda: [ContactValidator.scan_html(html) for html in pages], args.repeat)
+    full = bench(lambda: ContactValidator.extract_from_batch(pages), args.repeat)
+
+    print(f"{'separate re.findall passes':<32} {old * 1000:8.1f} ms")
+    print(f"{'single-pass scan_html':<32} {new * 1000:8.1f} ms  ({old / new:.1f}x)")
+    print(f"{'extract_from_batch (validated)':<32} {full * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
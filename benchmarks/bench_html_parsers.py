@@ -0,0 +1,95 @@
+"""
+Per-page CPU cost of the HTML parser backends used by TechStackAnalyzer.
+
+Builds a synthetic WordPress-style agency page and times building the
+link/form index with each available backend.
+
+Usage:
+    python -m benchmarks.bench_html_parsers [--size-kb 2000] [--repeat 5]
+"""
+import argparse
+import random
+import time
+
+from src.analyzers.parsers import PARSERS, get_parser
+from src.analyzers.tech_stack import TECH_MATCHER
+
+
+def make_page(size_kb: int, seed: int = 1) -> str:
+    """Synthetic listing page: nav links, property cards, scripts and a contact form"""
+    rng = random.Random(seed)
+    parts = [
+        "<!DOCTYPE html><html><head><title>Inmobiliaria</title>",
+        '<meta property="og:title" content="Inmobiliaria">',
+        "<script src=\"/wp-content/themes/x/app.js\"></script></head><body>",
+        '<nav><a href="/">Inicio</a><a href="/propiedades">Propiedades</a>'
+        '<a href="/contacto">Contacto</a><a href="/blog">Blog</a></nav>',
+    ]
+    card = (
+        '<div class="card property-{i}"><a href="/propiedad/{i}"><img src="/img/{i}.jpg" alt="Depto {i}"></a>'
+        "<h3>Departamento {i} ambientes</h3><p>{text}</p>"
+        '<span class="price">USD {price}</span></div>'
+    )
+    words = "luminoso balcon cochera amenities pileta parrilla vista frente contrafrente".split()
+    i = 0
+    while sum(len(p) for p in parts) < size_kb * 1024:
+        text = " ".join(rng.choice(words) for _ in range(40))
+        parts.append(card.format(i=i, text=text, price=rng.randint(50, 900) * 1000))
+        i += 1
+    parts.append(
+        '<form action="/enviar" class="wpcf7-form"><label>Nombre</label><input name="nombre">'
+        '<input type="email" name="email"><textarea name="mensaje"></textarea>'
+        "<button type=\"submit\">Enviar</button></form>"
+        '<footer><a href="https://www.facebook.com/inmo">fb</a>'
+        '<a href="https://instagram.com/inmo">ig</a><a href="https://wa.me/5491100000000">wa</a></footer>'
+        "</body></html>"
+    )
+    return "".join(parts)
+
+
+def bench(fn, repeat: int) -> float:
+    """Best-of-N CPU seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-kb", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = make_page(args.size_kb)
+    print(f"Page size: {len(html) / 1024:.0f} KB")
+
+    scan = bench(lambda: TECH_MATCHER.scan(html), args.repeat)
+    print(f"{'substring rules (no DOM)':<28} {scan * 1000:8.1f} ms")
+
+    baseline = None
+    for name, (_, available) in PARSERS.items():
+        if not available:
+            print(f"{name:<28} not installed")
+            continue
+        backend = get_parser(name)
+        if backend.name != name:
+            print(f"{name:<28} not installed")
+            continue
+        elapsed = bench(lambda: backend.build_index(html), args.repeat)
+        if name == "bs4":
+            baseline = elapsed
+        print(f"{'index via ' + name:<28} {elapsed * 1000:8.1f} ms")
+
+    if baseline:
+        for name in ("lxml", "selectolax"):
+            backend = get_parser(name)
+            if backend.name == name:
+                elapsed = bench(lambda: backend.build_index(html), args.repeat)
+                print(f"{name} vs bs4: {baseline / elapsed:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from src.config import get_settings
+
+# Query params that only track the visit and never change the page
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "ref", "source"}
+
+
+def canonical_site_key(url: str) -> str:
+    """
+    Canonical key for a website URL
+
+    Scheme, "www.", default ports, fragments, trailing slashes and
+    tracking params are dropped, so "https://www.remax.com.ar/?utm_source=gmb"
+    and "remax.com.ar" share one key.
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").rstrip(".")
+        port = parts.port
+    except ValueError:
+        return url.lower()
+
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+
+    key = host + parts.path.rstrip("/")
+    if query:
+        key += "?" + urlencode(query)
+    return key
+
+
+class AnalysisCache:
+    """
+    In-memory cache of website analyses with TTL and least-recently-used
+    eviction, keyed by canonical_site_key.
+
+    Concurrent lookups for the same site share a single in-flight
+    analysis instead of each fetching the page.
+    """
+
+    def __init__(self, ttl_seconds: int = 21600, max_entries: int = 5000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+
+    async def get_or_analyze(
+        self,
+        url: str,
+        validators: Optional[Dict[str, Optional[str]]],
+        analyze: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return a cached analysis for url, joining or starting one if needed
+
+        Args:
+            url: Website URL
+            validators: Validators of the caller's previous analysis
+            analyze: Runs the actual analysis
+
+        Returns:
+            A copy of the analysis result
+        """
+        key = canonical_site_key(url)
+        content_hash = (validators or {}).get("content_hash")
+
+        cached = self._lookup(key, content_hash)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        # Conditional requests are only interchangeable for the same stored page
+        flight = (key, content_hash)
+        task = self._inflight.get(flight)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(analyze())
+            self._inflight[flight] = task
+            task.add_done_callback(lambda done: self._finish(flight, done))
+        else:
+            self.coalesced += 1
+
+        # Shielded so one caller going away doesn't cancel it for the rest
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _lookup(self, key: str, content_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        created_at, result = entry
+        if time.time() - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        # Only the caller that already has this page can use an "unchanged" entry
+        same_page = content_hash is not None and content_hash == result.get("content_hash")
+        if result.get("unchanged") and not same_page:
+            return None
+
+        self._entries.move_to_end(key)
+        result = copy.deepcopy(result)
+        if same_page:
+            result["unchanged"] = True
+        return result
+
+    def _finish(self, flight: Tuple[str, Optional[str]], task: asyncio.Future) -> None:
+        if self._inflight.get(flight) is task:
+            del self._inflight[flight]
+        if not task.cancelled() and task.exception() is None:
+            self.set(flight[0], task.result())
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result and evict the least recently used entries over the limit"""
+        # Never cache failed fetches
+        if not result.get("has_website") or result.get("detection_details", {}).get("error"):
+            return
+
+        # Keep a full analysis rather than replacing it with a bare "unchanged"
+        existing = self._entries.get(key)
+        if result.get("unchanged") and existing and not existing[1].get("unchanged"):
+            return
+
+        self._entries[key] = (time.time(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached analysis"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/coalesced counters and current size"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+            "in_flight": len(self._inflight),
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+@lru_cache()
+def get_analysis_cache() -> Optional[AnalysisCache]:
+    """Return the process-wide analysis cache, or None if disabled"""
+    settings = get_settings()
+    if not settings.analyzer_cache_enabled:
+        return None
+    return AnalysisCache(
+        ttl_seconds=settings.analyzer_cache_ttl_seconds,
+        max_entries=settings.analyzer_cache_max_entries,
+    )
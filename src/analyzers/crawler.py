@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from urllib.parse import urljoin, urlsplit
+from src.analyzers.cache import canonical_site_key
+
+# fetch(url) -> {"url": final url, "contacts": {...}, "links": [...]} or None
+PageFetcher = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def _site_host(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class SiteCrawler:
+    """
+    Small breadth-first crawler over one site's contact pages.
+
+    Follows links returned by `fetch` from a frontier, restricted to the
+    start page's host, never visiting a URL twice and stopping at
+    max_pages pages or max_depth links away from the homepage. Up to
+    `concurrency` pages are fetched at once.
+    """
+
+    def __init__(self, fetch: PageFetcher, max_pages: int = 3, max_depth: int = 2, concurrency: int = 3):
+        self.fetch = fetch
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+
+    async def crawl(self, start_url: str, links: List[str]) -> List[Dict[str, Any]]:
+        """
+        Crawl outward from a page that was already fetched
+
+        Args:
+            start_url: Final URL of the homepage
+            links: Candidate hrefs found on it
+
+        Returns:
+            Fetched pages in the order they were scheduled
+        """
+        host = _site_host(start_url)
+        visited: Set[str] = {canonical_site_key(start_url)}
+        frontier: asyncio.Queue = asyncio.Queue()
+        pages: Dict[int, Dict[str, Any]] = {}
+        scheduled = 0
+
+        def schedule(base_url: str, hrefs: List[str], depth: int) -> None:
+            nonlocal scheduled
+            for href in hrefs:
+                if scheduled >= self.max_pages or depth > self.max_depth:
+                    return
+                url = urljoin(base_url, href.strip()).split("#", 1)[0]
+                key = canonical_site_key(url)
+                if not url.startswith(("http://", "https://")) or key in visited:
+                    continue
+                if _site_host(url) != host:
+                    continue
+                visited.add(key)
+                frontier.put_nowait((scheduled, url, depth))
+                scheduled += 1
+
+        async def worker() -> None:
+            while True:
+                order, url, depth = await frontier.get()
+                try:
+                    page = await self.fetch(url)
+                    if page is not None:
+                        pages[order] = page
+                        # Redirects count as visited too
+                        visited.add(canonical_site_key(page["url"]))
+                        schedule(page["url"], page["links"], depth + 1)
+                except Exception:
+                    pass
+                finally:
+                    frontier.task_done()
+
+        schedule(start_url, links, 1)
+        if not scheduled:
+            return []
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await frontier.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return [pages[order] for order in sorted(pages)]
@@ -0,0 +1,142 @@
+import socket
+import ssl
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+import httpx
+from src.config import get_settings
+
+# Consecutive failures of a kind before a host is skipped. DNS and TLS
+# failures don't fix themselves between two attempts; timeouts and 5xx might.
+FAILURE_THRESHOLDS = {
+    "dns": 1,
+    "tls": 1,
+    "connect_timeout": 2,
+    "connect_error": 2,
+    "read_timeout": 2,
+    "server_error": 3,
+}
+
+DNS_ERROR_MARKERS = ["name or service not known", "nodename nor servname", "getaddrinfo", "no address associated"]
+TLS_ERROR_MARKERS = ["ssl", "certificate", "tls"]
+
+
+def _error_chain(error: BaseException):
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def classify_failure(error: BaseException) -> Optional[str]:
+    """
+    Kind of host failure behind an httpx error, or None if the host
+    itself isn't to blame (4xx, pool timeouts, our own bugs)
+    """
+    if isinstance(error, httpx.ConnectTimeout):
+        return "connect_timeout"
+    if isinstance(error, (httpx.ReadTimeout, httpx.WriteTimeout)):
+        return "read_timeout"
+    if isinstance(error, httpx.HTTPStatusError):
+        return "server_error" if error.response.status_code >= 500 else None
+    if isinstance(error, httpx.ConnectError):
+        for cause in _error_chain(error):
+            if isinstance(cause, socket.gaierror):
+                return "dns"
+            if isinstance(cause, ssl.SSLError):
+                return "tls"
+        message = str(error).lower()
+        if any(marker in message for marker in DNS_ERROR_MARKERS):
+            return "dns"
+        if any(marker in message for marker in TLS_ERROR_MARKERS):
+            return "tls"
+        return "connect_error"
+    return None
+
+
+class HostRecord:
+    """Failure streak and backoff state of one host"""
+
+    def __init__(self):
+        self.failures = 0
+        self.last_failure: Optional[str] = None
+        self.trips = 0
+        self.open_until = 0.0
+
+
+class HostHealth:
+    """
+    Per-host circuit breaker for website analysis.
+
+    After FAILURE_THRESHOLDS[kind] consecutive failures a host is
+    skipped for a backoff window that doubles each time it trips again,
+    up to max_backoff_seconds. A success closes the circuit.
+    """
+
+    def __init__(self, backoff_seconds: int = 900, max_backoff_seconds: int = 86400, max_hosts: int = 20000):
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.max_hosts = max_hosts
+        self.skipped = 0
+        self._hosts: "OrderedDict[str, HostRecord]" = OrderedDict()
+
+    def blocked(self, host: str) -> Optional[Dict[str, Any]]:
+        """Return why host is being skipped, or None if it may be fetched"""
+        record = self._hosts.get(host)
+        if record is None or record.open_until <= time.time():
+            return None
+        self.skipped += 1
+        return {
+            "reason": record.last_failure,
+            "failures": record.failures,
+            "retry_after": round(record.open_until - time.time()),
+        }
+
+    def record_success(self, host: str) -> None:
+        self._hosts.pop(host, None)
+
+    def record_failure(self, host: str, kind: str) -> None:
+        record = self._hosts.get(host)
+        if record is None:
+            record = self._hosts[host] = HostRecord()
+            while len(self._hosts) > self.max_hosts:
+                self._hosts.popitem(last=False)
+        self._hosts.move_to_end(host)
+
+        if record.last_failure != kind:
+            record.failures = 0
+        record.failures += 1
+        record.last_failure = kind
+
+        if record.failures >= FAILURE_THRESHOLDS.get(kind, 1):
+            record.trips += 1
+            window = min(self.backoff_seconds * 2 ** (record.trips - 1), self.max_backoff_seconds)
+            record.open_until = time.time() + window
+
+    def stats(self) -> Dict[str, Any]:
+        """Return how many hosts are currently skipped, by failure kind"""
+        now = time.time()
+        open_by_kind: Dict[str, int] = {}
+        for record in self._hosts.values():
+            if record.open_until > now:
+                open_by_kind[record.last_failure] = open_by_kind.get(record.last_failure, 0) + 1
+        return {
+            "tracked_hosts": len(self._hosts),
+            "open_hosts": sum(open_by_kind.values()),
+            "open_by_kind": open_by_kind,
+            "skipped": self.skipped,
+        }
+
+
+@lru_cache()
+def get_host_health() -> Optional[HostHealth]:
+    """Return the process-wide host health registry, or None if disabled"""
+    settings = get_settings()
+    if not settings.analyzer_host_backoff_seconds:
+        return None
+    return HostHealth(
+        backoff_seconds=settings.analyzer_host_backoff_seconds,
+        max_backoff_seconds=settings.analyzer_host_backoff_max_seconds,
+    )
@@ -0,0 +1,112 @@
+from typing import Dict, List, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# A rule hit: (category, label), e.g. ("chat", "tidio")
+Hit = Tuple[str, str]
+
+
+class PatternMatcher:
+    """
+    Matches many substring rules against a page in a single pass.
+
+    Rules are compiled once into an Aho-Corasick automaton (pyahocorasick)
+    over the lowercased page; case-sensitive rules are then confirmed
+    against the original text at the reported offsets. Without
+    pyahocorasick it falls back to one substring check per distinct
+    pattern, still sharing a single lowercased copy of the page.
+    """
+
+    def __init__(self, rules: List[Tuple[str, str, str, bool]]):
+        """
+        Args:
+            rules: (category, label, pattern, case_sensitive) tuples
+        """
+        # pattern key -> [(original pattern, case_sensitive, hit)]
+        self._rules: Dict[str, List[Tuple[str, bool, Hit]]] = {}
+        for category, label, pattern, case_sensitive in rules:
+            key = pattern.lower()
+            self._rules.setdefault(key, []).append((pattern, case_sensitive, (category, label)))
+
+        # Characters a match can straddle between two chunks of a stream
+        self.overlap = max((len(key) for key in self._rules), default=1) - 1
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for key in self._rules:
+                self._automaton.add_word(key, key)
+            self._automaton.make_automaton()
+
+    def scan(self, text: str) -> Set[Hit]:
+        """Return every (category, label) whose pattern occurs in text"""
+        text_lower = text.lower()
+
+        if self._automaton is None:
+            return self._scan_fallback(text, text_lower)
+
+        # Offsets only line up when lowercasing kept the length
+        same_length = len(text_lower) == len(text)
+        hits: Set[Hit] = set()
+        pending = {key: entries for key, entries in self._rules.items()}
+
+        for end, key in self._automaton.iter(text_lower):
+            entries = pending.get(key)
+            if not entries:
+                continue
+
+            start = end - len(key) + 1
+            remaining = []
+            for pattern, case_sensitive, hit in entries:
+                if not case_sensitive:
+                    hits.add(hit)
+                elif same_length and text[start:end + 1] == pattern:
+                    hits.add(hit)
+                elif not same_length and pattern in text:
+                    hits.add(hit)
+                else:
+                    remaining.append((pattern, case_sensitive, hit))
+
+            if remaining:
+                pending[key] = remaining
+            else:
+                del pending[key]
+                if not pending:
+                    break
+
+        return hits
+
+    def _scan_fallback(self, text: str, text_lower: str) -> Set[Hit]:
+        hits: Set[Hit] = set()
+        for key, entries in self._rules.items():
+            if key not in text_lower:
+                continue
+            for pattern, case_sensitive, hit in entries:
+                if not case_sensitive or pattern in text:
+                    hits.add(hit)
+        return hits
+
+
+class StreamScan:
+    """
+    Runs a PatternMatcher over text that arrives in chunks.
+
+    The last `overlap` characters of each chunk are carried over so
+    patterns split across two chunks are still found.
+    """
+
+    def __init__(self, matcher: PatternMatcher):
+        self.matcher = matcher
+        self.hits: Set[Hit] = set()
+        self._tail = ""
+
+    def feed(self, text: str) -> Set[Hit]:
+        """Scan the next chunk and return every hit so far"""
+        window = self._tail + text
+        self.hits |= self.matcher.scan(window)
+        self._tail = window[-self.matcher.overlap:] if self.matcher.overlap else ""
+        return self.hits
@@ -0,0 +1,114 @@
+from typing import Any, Callable, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+# Substrings of lowercased hrefs that detectors look links up by
+LINK_KEYWORDS = [
+    "contact",  # also matches "contacto"
+    "nosotros",  # "quienes-somos" style pages often list agents' emails
+    "/blog",
+    "/noticias",
+    "/articulos",
+    "/news",
+    "/novedades",
+]
+
+# Tags a parser has to visit to build the index
+INDEXED_TAGS = ["a", "form", "meta", "input", "textarea", "select", "button", "label"]
+
+# Attributes that describe what a form or field is for
+DESCRIPTIVE_ATTRS = ["name", "id", "class", "type", "placeholder", "action", "value"]
+
+
+def describe(tag_name: str, get: Callable[[str], Any], text: Callable[[], str]) -> List[str]:
+    """
+    Lowercased descriptive attribute values and text of a tag.
+
+    Parser-agnostic: `get` reads an attribute and `text` returns the
+    tag's text, which is only needed for buttons and labels.
+    """
+    parts = []
+    for attr in DESCRIPTIVE_ATTRS:
+        value = get(attr)
+        if value:
+            parts.append(" ".join(value) if isinstance(value, list) else str(value))
+    if tag_name in ("button", "label"):
+        parts.append(text())
+    return [part.lower() for part in parts]
+
+
+def _host_of(href: str) -> str:
+    """Host of a link, also for scheme-less ones like "facebook.com/agencia" """
+    try:
+        host = urlparse(href).hostname
+        if not host:
+            first_segment = href.split("/", 1)[0]
+            if "." in first_segment and ":" not in first_segment:
+                host = urlparse("//" + href).hostname
+    except ValueError:
+        return ""
+    return host or ""
+
+
+class FormInfo:
+    """A form and the names/labels of its fields"""
+
+    def __init__(self, parts: List[str]):
+        self.field_names: List[str] = []
+        self._parts: List[str] = parts
+
+    def add_field(self, name: Optional[str], parts: List[str]) -> None:
+        if name:
+            self.field_names.append(str(name))
+        self._parts.extend(parts)
+
+    @property
+    def signature(self) -> str:
+        """Everything descriptive about the form, lowercased, for keyword checks"""
+        return " ".join(self._parts)
+
+
+class PageIndex:
+    """
+    Links, forms and meta tags of a parsed page, collected in one traversal.
+
+    Detectors query the index instead of each walking the DOM with
+    their own find_all calls. Indexes are built by the parser backends
+    in src.analyzers.parsers.
+    """
+
+    def __init__(self):
+        self.links: List[str] = []
+        self.links_by_host: Dict[str, List[str]] = {}
+        self.links_by_keyword: Dict[str, List[str]] = {keyword: [] for keyword in LINK_KEYWORDS}
+        self.forms: List[FormInfo] = []
+        self.meta_properties: Set[str] = set()
+
+    def add_form(self, parts: List[str]) -> FormInfo:
+        form = FormInfo(parts)
+        self.forms.append(form)
+        return form
+
+    def add_meta_property(self, prop: str) -> None:
+        self.meta_properties.add(str(prop).lower())
+
+    def add_link(self, href: str) -> None:
+        self.links.append(href)
+
+        href_lower = href.lower()
+        for keyword, bucket in self.links_by_keyword.items():
+            if keyword in href_lower:
+                bucket.append(href)
+
+        self.links_by_host.setdefault(_host_of(href_lower), []).append(href)
+
+    def links_with(self, keyword: str) -> List[str]:
+        """Links whose lowercased href contains one of LINK_KEYWORDS"""
+        return self.links_by_keyword[keyword]
+
+    def links_to(self, domain: str) -> List[str]:
+        """Links pointing at a domain or any of its subdomains"""
+        links = []
+        for host, hrefs in self.links_by_host.items():
+            if host == domain or host.endswith("." + domain):
+                links.extend(hrefs)
+        return links
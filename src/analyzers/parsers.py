@@ -0,0 +1,200 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from src.analyzers.page_index import PageIndex, INDEXED_TAGS, describe
+from src.config import get_settings
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+
+def _lxml_text(el) -> str:
+    return " ".join(el.text_content().split())
+
+
+class HtmlParser(ABC):
+    """Builds a PageIndex from raw HTML with a particular parser library"""
+
+    name = ""
+
+    @abstractmethod
+    def build_index(self, html: str) -> PageIndex:
+        """Collect links, forms and meta tags of the page in one traversal"""
+        pass
+
+
+class LxmlParser(HtmlParser):
+    """lxml.html without the BeautifulSoup tree on top"""
+
+    name = "lxml"
+
+    def build_index(self, html: str) -> PageIndex:
+        index = PageIndex()
+        if not html.strip():
+            return index
+
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # lxml rejects str documents that carry an XML encoding declaration
+            try:
+                root = lxml.html.document_fromstring(html.encode("utf-8", "replace"))
+            except etree.ParserError:
+                return index
+        except etree.ParserError:
+            return index
+
+        forms: Dict[int, object] = {}
+
+        for el in root.iter(*INDEXED_TAGS):
+            tag = el.tag
+            if tag == "a":
+                href = el.get("href")
+                if href is not None:
+                    index.add_link(href)
+
+            elif tag == "form":
+                forms[id(el)] = index.add_form(describe(tag, el.get, lambda: _lxml_text(el)))
+
+            elif tag == "meta":
+                prop = el.get("property")
+                if prop:
+                    index.add_meta_property(prop)
+
+            else:
+                for form in el.iterancestors("form"):
+                    info = forms.get(id(form))
+                    if info is not None:
+                        info.add_field(el.get("name"), describe(tag, el.get, lambda: _lxml_text(el)))
+                    break
+
+        return index
+
+
+class SelectolaxParser(HtmlParser):
+    """selectolax (lexbor), the fastest option when installed"""
+
+    name = "selectolax"
+
+    def build_index(self, html: str) -> PageIndex:
+        index = PageIndex()
+        tree = LexborHTMLParser(html)
+        forms: Dict[int, object] = {}
+
+        for node in tree.css(", ".join(INDEXED_TAGS)):
+            tag = node.tag
+            attrs = node.attributes
+            if tag == "a":
+                href = attrs.get("href")
+                if href is not None:
+                    index.add_link(href)
+
+            elif tag == "form":
+                forms[node.mem_id] = index.add_form(describe(tag, attrs.get, lambda: node.text(separator=" ", strip=True)))
+
+            elif tag == "meta":
+                prop = attrs.get("property")
+                if prop:
+                    index.add_meta_property(prop)
+
+            else:
+                parent = node.parent
+                while parent is not None and parent.tag != "form":
+                    parent = parent.parent
+                if parent is not None and parent.mem_id in forms:
+                    forms[parent.mem_id].add_field(
+                        attrs.get("name"),
+                        describe(tag, attrs.get, lambda: node.text(separator=" ", strip=True)),
+                    )
+
+        return index
+
+
+class BeautifulSoupParser(HtmlParser):
+    """BeautifulSoup on top of lxml, the original (slowest) backend"""
+
+    name = "bs4"
+
+    def build_index(self, html: str) -> PageIndex:
+        from bs4 import BeautifulSoup
+
+        index = PageIndex()
+        soup = BeautifulSoup(html, "lxml")
+        forms: Dict[int, object] = {}
+
+        for tag in soup.find_all(INDEXED_TAGS):
+            if tag.name == "a":
+                href = tag.get("href")
+                if href is not None:
+                    index.add_link(href)
+
+            elif tag.name == "form":
+                forms[id(tag)] = index.add_form(describe(tag.name, tag.get, lambda: tag.get_text(" ", strip=True)))
+
+            elif tag.name == "meta":
+                prop = tag.get("property")
+                if prop:
+                    index.add_meta_property(prop)
+
+            else:
+                form = tag.find_parent("form")
+                if form is not None and id(form) in forms:
+                    forms[id(form)].add_field(
+                        tag.get("name"),
+                        describe(tag.name, tag.get, lambda: tag.get_text(" ", strip=True)),
+                    )
+
+        return index
+
+
+PARSERS = {
+    "lxml": (LxmlParser, LXML_AVAILABLE),
+    "selectolax": (SelectolaxParser, SELECTOLAX_AVAILABLE),
+    "bs4": (BeautifulSoupParser, LXML_AVAILABLE),
+}
+
+
+def get_parser(name: Optional[str] = None) -> HtmlParser:
+    """
+    Return the configured parser backend.
+
+    Falls back to lxml when the requested backend is not installed.
+    """
+    name = name or get_settings().analyzer_html_parser
+    parser_cls, available = PARSERS.get(name, PARSERS["lxml"])
+    if not available:
+        parser_cls = LxmlParser
+    return parser_cls()
+
+
+class ParsedPage:
+    """
+    A fetched page whose DOM is only built when a detector needs it.
+
+    Substring detectors work on `html` directly; `index` parses the
+    page on first access and is cached afterwards.
+    """
+
+    def __init__(self, html: str, parser: Optional[HtmlParser] = None):
+        self.html = html
+        self.parser = parser or get_parser()
+        self._index: Optional[PageIndex] = None
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._index is not None
+
+    @property
+    def index(self) -> PageIndex:
+        if self._index is None:
+            self._index = self.parser.build_index(self.html)
+        return self._index
@@ -0,0 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from src.config import get_settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _warm_up() -> None:
+    """Import the analyzers (and compile their matchers) once per worker process"""
+    import src.analyzers.tech_stack  # noqa: F401
+
+
+def get_analysis_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Shared process pool for parsing and detection.
+
+    Returns None when ANALYZER_PROCESS_WORKERS is 0, in which case
+    analysis runs in-process on the event loop.
+    """
+    global _executor
+    workers = get_settings().analyzer_process_workers
+    if workers <= 0:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_up)
+    return _executor
+
+
+def reset_analysis_executor() -> None:
+    """Drop a broken pool so the next analysis starts a fresh one"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def shutdown_analysis_executor() -> None:
+    """Stop the worker processes (on app shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
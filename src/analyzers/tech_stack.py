@@ -1,9 +1,30 @@
-import re
 import asyncio
-from typing import Dict, Any, Optional, List
+import codecs
+import hashlib
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Set
 from urllib.parse import urlparse
 import httpx
-from bs4 import BeautifulSoup
+from src.analyzers.cache import get_analysis_cache
+from src.analyzers.crawler import SiteCrawler
+from src.analyzers.host_health import classify_failure, get_host_health
+from src.analyzers.matcher import PatternMatcher, StreamScan, Hit
+from src.analyzers.page_index import PageIndex
+from src.analyzers.parsers import ParsedPage, HtmlParser, get_parser
+from src.analyzers.url_classifier import classify_website
+from src.analyzers.process_pool import get_analysis_executor, reset_analysis_executor
+from src.config import get_settings
+from src.validators.contact import ContactValidator
+
+settings = get_settings()
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 # Chat widget providers and their detection patterns
@@ -38,29 +59,338 @@ CRM_PATTERNS = {
     "navent": ["navent"],
 }
 
+# WhatsApp links and button markup
+WHATSAPP_PATTERNS = [
+    "wa.me",
+    "api.whatsapp.com",
+    "whatsapp:",
+    "whatsapp",
+    "wa-button",
+    "whatsapp-button",
+    "btn-whatsapp",
+    "fab fa-whatsapp",
+    "icon-whatsapp",
+]
+
+# Analytics and tracking scripts (matched case-sensitively)
+ANALYTICS_PATTERNS = {
+    "has_google_analytics": [
+        "google-analytics.com/analytics.js",
+        "googletagmanager.com/gtag/js",
+        "gtag('config'",
+        "ga('create'",
+        "_gaq.push",
+        "UA-",
+        "G-",  # GA4
+    ],
+    "has_google_tag_manager": [
+        "googletagmanager.com/gtm.js",
+        "GTM-",
+    ],
+    "has_facebook_pixel": [
+        "connect.facebook.net",
+        "fbq('init'",
+        "facebook.com/tr",
+        "_fbq",
+    ],
+}
+
+# Links the contact crawler follows
+CRAWL_LINK_KEYWORDS = ["contact", "nosotros"]
+
+# Stored per page so re-analysis can skip unchanged sites
+VALIDATOR_FIELDS = ["etag", "last_modified", "content_hash"]
+
+# Markup that suggests a CMS with blog support
+BLOG_CMS_PATTERNS = ["wp-content", "wordpress"]
+
+# Blog section links
+BLOG_LINK_PATTERNS = ["/blog", "/noticias", "/articulos", "/news", "/novedades"]
+
+# Markup a DOM-based detector looks for; pages without any of it are
+# never parsed for that detector
+DOM_PRECHECKS = {
+    "form": ["<form"],
+    "social": ["facebook.com", "instagram.com", "linkedin.com", "fb:page_id"],
+    "blog_link": BLOG_LINK_PATTERNS,
+}
+
+
+def _build_matcher() -> PatternMatcher:
+    """Compile every substring rule used by the detectors into one matcher"""
+    rules = []
+    for provider, patterns in CHAT_PROVIDERS.items():
+        rules.extend(("chat", provider, pattern, False) for pattern in patterns)
+    for provider, patterns in CRM_PATTERNS.items():
+        rules.extend(("crm", provider, pattern, False) for pattern in patterns)
+    for flag, patterns in ANALYTICS_PATTERNS.items():
+        rules.extend(("analytics", flag, pattern, True) for pattern in patterns)
+    rules.extend(("whatsapp", "whatsapp", pattern, False) for pattern in WHATSAPP_PATTERNS)
+    rules.extend(("blog", "cms", pattern, False) for pattern in BLOG_CMS_PATTERNS)
+    for check, patterns in DOM_PRECHECKS.items():
+        rules.extend(("dom", check, pattern, False) for pattern in patterns)
+    return PatternMatcher(rules)
+
+
+TECH_MATCHER = _build_matcher()
+
+
+class PageBody:
+    """
+    A response body read in chunks.
+
+    With `scan` the chunks are decoded and run through TECH_MATCHER as
+    they arrive and only the text is kept; otherwise the raw bytes are
+    kept for decoding elsewhere (the process pool).
+    """
+
+    def __init__(self, encoding: str, scan: bool):
+        self.encoding = encoding
+        self.size = 0
+        self.stopped: Optional[str] = None  # "max_bytes" or "all_detected"
+        self.scan = StreamScan(TECH_MATCHER) if scan else None
+        self._chunks: List[bytes] = []
+        self._text: List[str] = []
+        self._decoder = None
+        self._hash = hashlib.sha256()
+        self._next_dom_check = 0
+
+        if scan:
+            try:
+                self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._hash.update(chunk)
+        if self._decoder is None:
+            self._chunks.append(chunk)
+            return
+        text = self._decoder.decode(chunk)
+        self._text.append(text)
+        self.scan.feed(text)
+
+    def dom_check_due(self) -> bool:
+        """Whether the text read so far should be parsed again (at doubling sizes)"""
+        if self.size < self._next_dom_check:
+            return False
+        self._next_dom_check = self.size * 2
+        return True
+
+    @property
+    def content(self) -> bytes:
+        return b"".join(self._chunks)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._text)
+
+    @property
+    def content_hash(self) -> str:
+        return self._hash.hexdigest()
+
+    def finish(self) -> None:
+        """Flush bytes the decoder held back waiting for the rest of a character"""
+        if self._decoder is not None:
+            self._text.append(self._decoder.decode(b"", final=True))
+
 
 class TechStackAnalyzer:
     """Analyzes websites to detect their technology stack"""
 
-    def __init__(self, timeout: float = 15.0):
-        self.timeout = timeout
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+        parser: Optional[HtmlParser] = None,
+        process_pool: Optional[bool] = None,
+        max_body_bytes: Optional[int] = None,
+        use_cache: bool = True,
+        extract_contacts: Optional[bool] = None,
+    ):
+        self.timeout = timeout or settings.analyzer_timeout
+        # Dead hosts fail on connect; only live ones get the full read timeout
+        self.connect_timeout = connect_timeout or settings.analyzer_connect_timeout
+        self.max_connections = max_connections or settings.analyzer_max_connections
+        self.max_connections_per_host = max_connections_per_host or settings.analyzer_max_connections_per_host
+        self.max_body_bytes = max_body_bytes or settings.analyzer_max_body_bytes
+        self.http2 = (settings.analyzer_http2 if http2 is None else http2) and HTTP2_AVAILABLE
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "es-AR,es;q=0.9,en;q=0.8",
         }
-
-    async def analyze(self, url: str) -> Dict[str, Any]:
+        self.parser = parser or get_parser()
+        # Process pool for parse + detect; None runs them on the event loop
+        self.executor: Optional[Executor] = None if process_pool is False else get_analysis_executor()
+        self.cache = get_analysis_cache() if use_cache else None
+        self.host_health = get_host_health()
+        # Also pull emails/phones/WhatsApp from the fetched pages
+        self.extract_contacts = settings.analyzer_extract_contacts if extract_contacts is None else extract_contacts
+        self.contact_pages = settings.analyzer_contact_pages
+        self.crawl_depth = settings.analyzer_crawl_depth
+        self.crawl_concurrency = settings.analyzer_crawl_concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Analyses running on the client; a coalesced one can outlive the caller that started it
+        self._running = 0
+        self._close_pending = False
+
+    async def __aenter__(self) -> "TechStackAnalyzer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, or once the analyses still using it finish"""
+        if self._running:
+            # Other requests may be waiting on a shared analysis that runs on this client
+            self._close_pending = True
+            return
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=min(self.connect_timeout, self.timeout)),
+                follow_redirects=True,
+                verify=False,  # Some sites have invalid certs
+                http2=self.http2,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Per-host limit so one domain can't take the whole pool"""
+        host = urlparse(url).hostname or ""
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_semaphores[host]
+
+    async def analyze(self, url: str, validators: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """
         Analyze a website and return tech stack information
 
         Args:
             url: Website URL to analyze
+            validators: etag/last_modified/content_hash of a previous
+                analysis; when the page hasn't changed the result has
+                "unchanged" set and no detections
+
+        Results have "skipped" set, and no detections, when the host is
+        in its circuit-breaker backoff window.
 
         Returns:
             Dict with detection results
         """
-        result = {
+        # Social profiles, portal listings and link-in-bio pages aren't
+        # the agency's own site; their flags come from the URL alone
+        flags = classify_website(url)
+        if flags is not None:
+            result = self._empty_result()
+            result.update(flags)
+            result["has_website"] = False
+            result["detection_details"]["skipped_fetch"] = True
+            return result
+
+        if self.cache is None:
+            return await self._analyze(url, validators)
+
+        # Leads sharing a website share one fetch and analysis
+        return await self.cache.get_or_analyze(url, validators, lambda: self._analyze(url, validators))
+
+    async def _analyze(self, url: str, validators: Optional[Dict[str, Optional[str]]]) -> Dict[str, Any]:
+        """Fetch and analyze a website, bypassing the analysis cache"""
+        self._running += 1
+        try:
+            return await self._fetch_and_analyze(url, validators)
+        finally:
+            self._running -= 1
+            if self._close_pending and not self._running:
+                self._close_pending = False
+                await self.aclose()
+
+    async def _fetch_and_analyze(self, url: str, validators: Optional[Dict[str, Optional[str]]]) -> Dict[str, Any]:
+        result = self._empty_result()
+
+        # Normalize URL
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+
+        # Don't spend a worker slot on a host that keeps failing
+        host = urlparse(url).hostname or ""
+        blocked = self.host_health.blocked(host) if self.host_health else None
+        if blocked:
+            # Not an analysis: callers keep whatever they had stored
+            result["skipped"] = True
+            result["detection_details"]["error"] = f"Skipped: host failing ({blocked['reason']})"
+            result["detection_details"]["host_health"] = blocked
+            return result
+
+        try:
+            client = self._get_client()
+
+            # Fetch page, streaming so oversized pages can be cut off
+            async with self._host_semaphore(url):
+                async with client.stream("GET", url, headers=self._conditional_headers(validators)) as response:
+                    if self.host_health and response.status_code < 500:
+                        self.host_health.record_success(host)
+
+                    if response.status_code == 304 and validators:
+                        # Servers may leave the validators out of a 304; keep the ones we sent
+                        fresh = self._page_validators(response, validators.get("content_hash"))
+                        result.update({key: value or validators.get(key) for key, value in fresh.items()})
+                        result["unchanged"] = True
+                        return result
+
+                    response.raise_for_status()
+                    body = await self._read_body(response)
+
+            result.update(self._page_validators(response, body.content_hash))
+            if validators and result["content_hash"] == validators.get("content_hash"):
+                result["unchanged"] = True
+                return result
+
+            # SSL status comes from where the redirects ended up
+            result["has_ssl"] = response.url.scheme == "https"
+
+            # Run all detections
+            result.update(await self._run_detections(body))
+            if self.extract_contacts:
+                await self._crawl_contact_pages(client, str(response.url), result.pop("contact_links"), result["contacts"])
+            if body.stopped:
+                result["detection_details"]["stopped_early"] = body.stopped
+                result["detection_details"]["bytes_read"] = body.size
+
+        except httpx.HTTPError as e:
+            result["has_website"] = False
+            result["detection_details"]["error"] = str(e) or type(e).__name__
+            failure = classify_failure(e)
+            if failure:
+                result["detection_details"]["failure"] = failure
+                if self.host_health:
+                    self.host_health.record_failure(host, failure)
+        except Exception as e:
+            result["detection_details"]["error"] = str(e)
+
+        return result
+
+    def _empty_result(self) -> Dict[str, Any]:
+        """Analysis result with every flag unset"""
+        return {
             "has_website": True,
             "has_ssl": False,
             "has_chat_widget": False,
@@ -80,152 +410,227 @@ class TechStackAnalyzer:
             "crm_provider": None,
             "has_blog": False,
             "detection_details": {},
+            "etag": None,
+            "last_modified": None,
+            "content_hash": None,
         }
 
-        # Normalize URL
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+    def _conditional_headers(self, validators: Optional[Dict[str, Optional[str]]]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers from a previous analysis"""
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _page_validators(self, response: httpx.Response, content_hash: Optional[str]) -> Dict[str, Optional[str]]:
+        """Validators to store for the next conditional request"""
+        return {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_hash": content_hash,
+        }
 
-        try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=False,  # Some sites have invalid certs
-            ) as client:
-                # Check SSL
-                parsed = urlparse(url)
-                result["has_ssl"] = parsed.scheme == "https" or await self._check_ssl(url, client)
+    async def _read_body(self, response: httpx.Response) -> PageBody:
+        """
+        Read a streamed response up to max_body_bytes.
 
-                # Fetch page
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
+        When detecting in-process the chunks are scanned as they arrive,
+        and reading stops as soon as every flag is already positive.
+        """
+        body = PageBody(response.encoding or "utf-8", scan=self.executor is None)
 
-                html = response.text
-                soup = BeautifulSoup(html, "lxml")
+        async for chunk in response.aiter_bytes():
+            room = self.max_body_bytes - body.size
+            body.feed(chunk[:room])
+            if len(chunk) > room:
+                body.stopped = "max_bytes"
+                break
+            # Contacts can be anywhere on the page, so no early exit when extracting them
+            if body.scan is not None and not self.extract_contacts and self._all_detected(body):
+                body.stopped = "all_detected"
+                break
 
-                # Run all detections
-                result.update(await self._detect_all(html, soup, url, client))
+        body.finish()
+        return body
 
-        except httpx.HTTPError as e:
-            result["has_website"] = False
-            result["detection_details"]["error"] = str(e)
-        except Exception as e:
-            result["detection_details"]["error"] = str(e)
+    def _all_detected(self, body: PageBody) -> bool:
+        """Whether reading more of the page can't change any flag"""
+        hits = body.scan.hits
+        categories = {category for category, _ in hits}
+        if not {"chat", "crm", "whatsapp", "blog"} <= categories:
+            return False
+        if not all(("analytics", flag) in hits for flag in ANALYTICS_PATTERNS):
+            return False
 
-        return result
+        # Forms and social links need the DOM; parsing the prefix only
+        # at doubling sizes keeps this linear in the page size
+        if not {("dom", "form"), ("dom", "social")} <= hits or not body.dom_check_due():
+            return False
+        index = self.parser.build_index(body.text)
+        social = self._detect_social_media(index)
+        return (
+            self._detect_contact_form(index)
+            and social["has_facebook"]
+            and social["has_instagram"]
+            and social["has_linkedin"]
+        )
+
+    async def _run_detections(self, body: PageBody) -> Dict[str, Any]:
+        """
+        Parse and detect either inline or in the process pool.
+
+        The pool gets the raw bytes and decodes them itself, so the
+        event loop only pays for the fetch.
+        """
+        if body.scan is not None:
+            # The DOM is only built if a detector needs it
+            page = ParsedPage(body.text, self.parser)
+            return self._detect_page(page, body.scan.hits)
 
-    async def _check_ssl(self, url: str, client: httpx.AsyncClient) -> bool:
-        """Check if site supports HTTPS"""
+        loop = asyncio.get_running_loop()
         try:
-            https_url = url.replace("http://", "https://")
-            await client.head(https_url, headers=self.headers)
-            return True
-        except Exception:
-            return False
+            return await loop.run_in_executor(
+                self.executor,
+                detect_page,
+                body.content,
+                body.encoding,
+                self.parser.name,
+                self.extract_contacts,
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM on a huge page); start over with a fresh pool
+            reset_analysis_executor()
+            self.executor = get_analysis_executor()
+            raise
+
+    def _detect_page(self, page: ParsedPage, hits: Optional[Set[Hit]] = None) -> Dict[str, Any]:
+        """Tech detections plus, if enabled, contacts and contact page links"""
+        results = self._detect_all(page, hits)
+        if self.extract_contacts:
+            results["contacts"] = ContactValidator.extract_from_html(page.html)
+            results["contact_links"] = _crawl_links(page)
+        return results
 
-    async def _detect_all(
+    async def _crawl_contact_pages(
         self,
-        html: str,
-        soup: BeautifulSoup,
-        base_url: str,
         client: httpx.AsyncClient,
-    ) -> Dict[str, Any]:
+        page_url: str,
+        links: List[str],
+        contacts: Dict[str, Any],
+    ) -> None:
+        """Crawl the site's contact pages and merge what they list into contacts"""
+        crawler = SiteCrawler(
+            lambda url: self._fetch_contact_page(client, url),
+            max_pages=self.contact_pages,
+            max_depth=self.crawl_depth,
+            concurrency=self.crawl_concurrency,
+        )
+        for page in await crawler.crawl(page_url, links):
+            ContactValidator.merge_contacts(contacts, page["contacts"])
+
+    async def _fetch_contact_page(self, client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch one contact page with the pooled client and extract its contacts and links"""
+        async with self._host_semaphore(url):
+            async with client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    return None
+                body = PageBody(response.encoding or "utf-8", scan=False)
+                async for chunk in response.aiter_bytes():
+                    body.feed(chunk[:self.max_body_bytes - body.size])
+                    if body.size >= self.max_body_bytes:
+                        break
+
+        if self.executor is None:
+            page = scan_contact_page(body.content, body.encoding, self.parser.name)
+        else:
+            loop = asyncio.get_running_loop()
+            page = await loop.run_in_executor(
+                self.executor, scan_contact_page, body.content, body.encoding, self.parser.name
+            )
+        page["url"] = str(response.url)
+        return page
+
+    def _detect_all(self, page: ParsedPage, hits: Optional[Set[Hit]] = None) -> Dict[str, Any]:
         """Run all detection methods"""
         results = {}
 
+        # One pass over the page for every substring rule (unless it was
+        # scanned while streaming). DOM-based detectors share one index of
+        # links/forms/meta tags, built only if the scan found markup they
+        # look for
+        if hits is None:
+            hits = TECH_MATCHER.scan(page.html)
+
         # Chat widget detection
-        chat_result = self._detect_chat_widget(html)
+        chat_result = self._detect_chat_widget(hits)
         results["has_chat_widget"] = chat_result["found"]
         results["chat_provider"] = chat_result["provider"]
 
         # WhatsApp detection
-        results["has_whatsapp_button"] = self._detect_whatsapp(html, soup)
+        results["has_whatsapp_button"] = self._detect_whatsapp(hits)
 
         # Contact form detection
-        results["has_contact_form"] = self._detect_contact_form(soup)
+        results["has_contact_form"] = ("dom", "form") in hits and self._detect_contact_form(page.index)
 
         # Social media detection
-        social = self._detect_social_media(soup, html)
+        social = self._detect_social_media(page.index if ("dom", "social") in hits else None)
         results.update(social)
 
         # Analytics detection
-        analytics = self._detect_analytics(html)
+        analytics = self._detect_analytics(hits)
         results.update(analytics)
 
         # CRM detection
-        crm_result = self._detect_crm(html, soup)
+        crm_result = self._detect_crm(hits)
         results["has_crm_forms"] = crm_result["found"]
         results["crm_provider"] = crm_result["provider"]
 
         # Blog detection
-        results["has_blog"] = self._detect_blog(soup, html)
+        results["has_blog"] = self._detect_blog(page, hits)
 
         return results
 
-    def _detect_chat_widget(self, html: str) -> Dict[str, Any]:
+    def _detect_chat_widget(self, hits: Set[Hit]) -> Dict[str, Any]:
         """Detect chat widget presence and provider"""
-        html_lower = html.lower()
-
-        for provider, patterns in CHAT_PROVIDERS.items():
-            for pattern in patterns:
-                if pattern.lower() in html_lower:
-                    return {"found": True, "provider": provider}
+        for provider in CHAT_PROVIDERS:
+            if ("chat", provider) in hits:
+                return {"found": True, "provider": provider}
 
         return {"found": False, "provider": None}
 
-    def _detect_whatsapp(self, html: str, soup: BeautifulSoup) -> bool:
+    def _detect_whatsapp(self, hits: Set[Hit]) -> bool:
         """Detect WhatsApp button/link"""
-        # Check for wa.me links
-        if re.search(r"wa\.me|api\.whatsapp\.com|whatsapp:", html, re.I):
-            return True
+        # wa.me / API links and WhatsApp icons/buttons; any link to them
+        # contains one of the patterns too
+        return ("whatsapp", "whatsapp") in hits
 
-        # Check for WhatsApp icons/buttons
-        whatsapp_patterns = [
-            "whatsapp",
-            "wa-button",
-            "whatsapp-button",
-            "btn-whatsapp",
-            "fab fa-whatsapp",
-            "icon-whatsapp",
+    def _detect_contact_form(self, index: PageIndex) -> bool:
+        """Detect contact forms"""
+        # Look for contact-related forms
+        contact_indicators = [
+            "contact",
+            "contacto",
+            "consulta",
+            "mensaje",
+            "email",
+            "telefono",
+            "nombre",
+            "submit",
+            "enviar",
         ]
 
-        for pattern in whatsapp_patterns:
-            if pattern in html.lower():
+        for form in index.forms:
+            signature = form.signature
+            if any(indicator in signature for indicator in contact_indicators):
                 return True
 
-        # Check links with phone numbers in WhatsApp format
-        for link in soup.find_all("a", href=True):
-            href = link["href"].lower()
-            if "whatsapp" in href or "wa.me" in href:
-                return True
-
-        return False
+        return len(index.forms) > 0
 
-    def _detect_contact_form(self, soup: BeautifulSoup) -> bool:
-        """Detect contact forms"""
-        forms = soup.find_all("form")
-
-        for form in forms:
-            form_str = str(form).lower()
-            # Look for contact-related forms
-            contact_indicators = [
-                "contact",
-                "contacto",
-                "consulta",
-                "mensaje",
-                "email",
-                "telefono",
-                "nombre",
-                "submit",
-                "enviar",
-            ]
-            if any(indicator in form_str for indicator in contact_indicators):
-                return True
-
-        return len(forms) > 0
-
-    def _detect_social_media(self, soup: BeautifulSoup, html: str) -> Dict[str, Any]:
-        """Detect social media presence"""
+    def _detect_social_media(self, index: Optional[PageIndex]) -> Dict[str, Any]:
+        """Detect social media presence (index is None if the page has no social markup)"""
         result = {
             "has_facebook": False,
             "facebook_url": None,
@@ -234,119 +639,115 @@ class TechStackAnalyzer:
             "has_linkedin": False,
             "linkedin_url": None,
         }
+        if index is None:
+            return result
 
-        # Find all links
-        links = soup.find_all("a", href=True)
-
-        for link in links:
-            href = link["href"]
-
-            # Facebook
-            if "facebook.com" in href and "/share" not in href:
+        # Facebook
+        for href in index.links_to("facebook.com"):
+            if "/share" not in href:
                 result["has_facebook"] = True
                 if "/pages/" in href or not href.endswith("facebook.com"):
                     result["facebook_url"] = href
 
-            # Instagram
-            if "instagram.com" in href:
-                result["has_instagram"] = True
-                result["instagram_url"] = href
+        # Instagram
+        for href in index.links_to("instagram.com"):
+            result["has_instagram"] = True
+            result["instagram_url"] = href
 
-            # LinkedIn
-            if "linkedin.com" in href:
-                result["has_linkedin"] = True
-                result["linkedin_url"] = href
+        # LinkedIn
+        for href in index.links_to("linkedin.com"):
+            result["has_linkedin"] = True
+            result["linkedin_url"] = href
 
         # Also check meta tags for social
-        og_facebook = soup.find("meta", property="fb:page_id")
-        if og_facebook:
+        if "fb:page_id" in index.meta_properties:
             result["has_facebook"] = True
 
         return result
 
-    def _detect_analytics(self, html: str) -> Dict[str, Any]:
+    def _detect_analytics(self, hits: Set[Hit]) -> Dict[str, Any]:
         """Detect analytics and tracking scripts"""
-        result = {
-            "has_google_analytics": False,
-            "has_google_tag_manager": False,
-            "has_facebook_pixel": False,
-        }
+        return {flag: ("analytics", flag) in hits for flag in ANALYTICS_PATTERNS}
 
-        # Google Analytics patterns
-        ga_patterns = [
-            "google-analytics.com/analytics.js",
-            "googletagmanager.com/gtag/js",
-            "gtag('config'",
-            "ga('create'",
-            "_gaq.push",
-            "UA-",
-            "G-",  # GA4
-        ]
-        for pattern in ga_patterns:
-            if pattern in html:
-                result["has_google_analytics"] = True
-                break
+    def _detect_crm(self, hits: Set[Hit]) -> Dict[str, Any]:
+        """Detect CRM integrations"""
+        for provider in CRM_PATTERNS:
+            if ("crm", provider) in hits:
+                return {"found": True, "provider": provider}
 
-        # Google Tag Manager
-        gtm_patterns = [
-            "googletagmanager.com/gtm.js",
-            "GTM-",
-        ]
-        for pattern in gtm_patterns:
-            if pattern in html:
-                result["has_google_tag_manager"] = True
-                break
+        return {"found": False, "provider": None}
 
-        # Facebook Pixel
-        fb_patterns = [
-            "connect.facebook.net",
-            "fbq('init'",
-            "facebook.com/tr",
-            "_fbq",
-        ]
-        for pattern in fb_patterns:
-            if pattern in html:
-                result["has_facebook_pixel"] = True
-                break
+    def _detect_blog(self, page: ParsedPage, hits: Set[Hit]) -> bool:
+        """Detect if site has a blog section"""
+        # Check for blog-related content
+        if ("blog", "cms") in hits:
+            return True
 
-        return result
+        # Check links
+        if ("dom", "blog_link") not in hits:
+            return False
+        return any(page.index.links_with(pattern) for pattern in BLOG_LINK_PATTERNS)
 
-    def _detect_crm(self, html: str, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Detect CRM integrations"""
-        html_lower = html.lower()
 
-        for provider, patterns in CRM_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in html_lower:
-                    return {"found": True, "provider": provider}
+@lru_cache()
+def _process_analyzer(parser_name: str, extract_contacts: bool) -> TechStackAnalyzer:
+    """Per-process analyzer used only for its detectors (never fetches)"""
+    return TechStackAnalyzer(
+        parser=get_parser(parser_name),
+        process_pool=False,
+        use_cache=False,
+        extract_contacts=extract_contacts,
+    )
 
-        return {"found": False, "provider": None}
 
-    def _detect_blog(self, soup: BeautifulSoup, html: str) -> bool:
-        """Detect if site has a blog section"""
-        blog_patterns = [
-            "/blog",
-            "/noticias",
-            "/articulos",
-            "/news",
-            "/novedades",
-        ]
+def _decode(content: bytes, encoding: str) -> str:
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
 
-        # Check links
-        for link in soup.find_all("a", href=True):
-            href = link["href"].lower()
-            if any(pattern in href for pattern in blog_patterns):
-                return True
 
-        # Check for blog-related content
-        html_lower = html.lower()
-        if "wp-content" in html_lower or "wordpress" in html_lower:
-            return True
+def detect_page(content: bytes, encoding: str, parser_name: str, extract_contacts: bool = False) -> Dict[str, Any]:
+    """
+    Decode a fetched page and run every detector on it.
+
+    Module-level so it can be sent to a worker process.
+
+    Args:
+        content: Raw response body
+        encoding: Response encoding
+        parser_name: HTML parser backend to use
+        extract_contacts: Also extract contacts and contact page links
+
+    Returns:
+        Dict with detection results
+    """
+    analyzer = _process_analyzer(parser_name, extract_contacts)
+    return analyzer._detect_page(ParsedPage(_decode(content, encoding), analyzer.parser))
+
+
+def _crawl_links(page: ParsedPage) -> List[str]:
+    """Links the contact crawler should follow from a page"""
+    html_lower = page.html.lower()
+    if not any(keyword in html_lower for keyword in CRAWL_LINK_KEYWORDS):
+        return []
+
+    links = []
+    for keyword in CRAWL_LINK_KEYWORDS:
+        links.extend(href for href in page.index.links_with(keyword) if href not in links)
+    return links
+
 
-        return False
+def scan_contact_page(content: bytes, encoding: str, parser_name: str) -> Dict[str, Any]:
+    """Decode a crawled page and extract its contacts and further links (worker-process safe)"""
+    page = ParsedPage(_decode(content, encoding), get_parser(parser_name))
+    return {
+        "contacts": ContactValidator.extract_from_html(page.html),
+        "links": _crawl_links(page),
+    }
 
 
 async def analyze_website(url: str) -> Dict[str, Any]:
     """Convenience function to analyze a website"""
-    analyzer = TechStackAnalyzer()
-    return await analyzer.analyze(url)
+    async with TechStackAnalyzer() as analyzer:
+        return await analyzer.analyze(url)
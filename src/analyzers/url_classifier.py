@@ -0,0 +1,90 @@
+import re
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+# Hosts that are a profile or listing rather than the agency's own site,
+# grouped by what they tell about the lead
+SOCIAL_HOSTS = {
+    "facebook.com": "facebook",
+    "fb.com": "facebook",
+    "fb.me": "facebook",
+    "instagram.com": "instagram",
+    "instagr.am": "instagram",
+    "linkedin.com": "linkedin",
+}
+MESSAGING_HOSTS = ["wa.me", "api.whatsapp.com", "whatsapp.com", "wa.link"]
+PORTAL_HOSTS = [
+    "zonaprop.com.ar",
+    "argenprop.com",
+    "mercadolibre.com.ar",
+    "properati.com.ar",
+    "inmuebles24.com",
+    "navent.com",
+    "tokkobroker.com",
+]
+LINK_IN_BIO_HOSTS = ["linktr.ee", "linkin.bio", "beacons.ai", "taplink.cc", "bio.link", "campsite.bio", "lnk.bio"]
+
+WHATSAPP_NUMBER_PATTERN = re.compile(r"(?:wa\.me/|phone=)\+?(\d{8,15})")
+
+
+def _matches(host: str, domains) -> Optional[str]:
+    """The domain host equals or is a subdomain of, if any"""
+    for domain in domains:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return None
+
+
+def classify_website(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Recognize websites that aren't the agency's own site without fetching them
+
+    Args:
+        url: Website URL from the listing
+
+    Returns:
+        TechStack flags to use instead of analyzing the page (always
+        with has_website False), or None if the URL should be fetched
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+
+    try:
+        host = (urlsplit(url).hostname or "").lower().rstrip(".")
+    except ValueError:
+        return None
+
+    domain = _matches(host, SOCIAL_HOSTS)
+    if domain:
+        network = SOCIAL_HOSTS[domain]
+        return {
+            f"has_{network}": True,
+            f"{network}_url": url,
+            "detection_details": {"website_kind": "social", "host": host},
+        }
+
+    if _matches(host, MESSAGING_HOSTS):
+        flags: Dict[str, Any] = {
+            "has_whatsapp_button": True,
+            "detection_details": {"website_kind": "messaging", "host": host},
+        }
+        match = WHATSAPP_NUMBER_PATTERN.search(url)
+        if match:
+            flags["contacts"] = {
+                "emails": [],
+                "phones": [],
+                "whatsapp": f"+{match.group(1)}",
+                "primary_email": None,
+                "primary_phone": None,
+            }
+        return flags
+
+    domain = _matches(host, PORTAL_HOSTS)
+    if domain:
+        return {"detection_details": {"website_kind": "portal", "host": host, "portal": domain}}
+
+    if _matches(host, LINK_IN_BIO_HOSTS):
+        return {"detection_details": {"website_kind": "link_in_bio", "host": host}}
+
+    return None
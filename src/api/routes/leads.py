@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional, List
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -159,6 +160,7 @@ async def delete_lead(
 @router.post("/{lead_id}/analyze", response_model=LeadResponse)
 async def analyze_lead(
     lead_id: int,
+    force: bool = Query(False, description="Re-analyze even if the page hasn't changed"),
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger tech stack analysis for a lead"""
@@ -174,24 +176,18 @@ async def analyze_lead(
     if not lead.website:
         raise HTTPException(status_code=400, detail="Lead has no website to analyze")
 
-    analyzer = TechStackAnalyzer()
-    analysis = await analyzer.analyze(lead.website)
+    async with TechStackAnalyzer(use_cache=not force) as analyzer:
+        analysis = await analyzer.analyze(lead.website, None if force else _page_validators(lead))
 
-    # Update or create tech_stack
-    if lead.tech_stack:
-        for key, value in analysis.items():
-            if hasattr(lead.tech_stack, key):
-                setattr(lead.tech_stack, key, value)
-        lead.tech_stack.analyzed_at = datetime.utcnow()
-    else:
-        tech_stack = TechStack(lead_id=lead.id, **analysis)
-        db.add(tech_stack)
+    if analysis.get("skipped"):
+        health = analysis["detection_details"]["host_health"]
+        raise HTTPException(
+            status_code=503,
+            detail=f"Website host is failing ({health['reason']}), retry in {health['retry_after']}s",
+            headers={"Retry-After": str(health["retry_after"])},
+        )
 
-    # Calculate and update score
-    from src.analyzers.scoring import calculate_opportunity_score
-    lead.opportunity_score = calculate_opportunity_score(analysis)
-    lead.is_analyzed = True
-    lead.analyzed_at = datetime.utcnow()
+    _apply_analysis(db, lead, analysis)
 
     await db.commit()
     await db.refresh(lead)
@@ -202,56 +198,156 @@ async def analyze_lead(
 @router.post("/analyze/batch")
 async def analyze_leads_batch(
     lead_ids: List[int],
+    force: bool = Query(False, description="Re-analyze even if pages haven't changed"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Analyze multiple leads"""
+    """
+    Analyze multiple leads concurrently.
+
+    Runs up to analyzer_batch_concurrency analyses at once (and at most
+    analyzer_max_connections_per_host per site), committing results in
+    chunks as they complete. Sites that haven't changed since their last
+    analysis are counted as unchanged and keep their detections; sites
+    whose host is in its failure backoff are counted as skipped and left
+    untouched.
+    """
     from src.analyzers.tech_stack import TechStackAnalyzer
-    from src.analyzers.scoring import calculate_opportunity_score
+    from src.config import get_settings
+
+    settings = get_settings()
+    results = {"success": 0, "unchanged": 0, "skipped": 0, "failed": 0, "errors": []}
 
-    analyzer = TechStackAnalyzer()
-    results = {"success": 0, "failed": 0, "errors": []}
+    lead_ids = list(dict.fromkeys(lead_ids))
+    query = select(Lead).where(Lead.id.in_(lead_ids)).options(selectinload(Lead.tech_stack))
+    leads = {lead.id: lead for lead in (await db.execute(query)).scalars().all()}
 
+    to_analyze = []
     for lead_id in lead_ids:
-        try:
-            query = select(Lead).where(Lead.id == lead_id).options(selectinload(Lead.tech_stack))
-            result = await db.execute(query)
-            lead = result.scalar_one_or_none()
+        lead = leads.get(lead_id)
+        if not lead:
+            results["failed"] += 1
+            results["errors"].append(f"Lead {lead_id} not found")
+        elif not lead.website:
+            results["failed"] += 1
+            results["errors"].append(f"Lead {lead_id} has no website")
+        else:
+            to_analyze.append(lead)
 
-            if not lead:
-                results["failed"] += 1
-                results["errors"].append(f"Lead {lead_id} not found")
-                continue
+    semaphore = asyncio.Semaphore(settings.analyzer_batch_concurrency)
 
-            if not lead.website:
-                results["failed"] += 1
-                results["errors"].append(f"Lead {lead_id} has no website")
-                continue
+    async def run(analyzer: TechStackAnalyzer, lead: Lead):
+        async with semaphore:
+            try:
+                validators = None if force else _page_validators(lead)
+                return lead, await analyzer.analyze(lead.website, validators), None
+            except Exception as e:
+                return lead, None, e
 
-            analysis = await analyzer.analyze(lead.website)
+    async with TechStackAnalyzer(use_cache=not force) as analyzer:
+        pending_commit = 0
 
-            if lead.tech_stack:
-                for key, value in analysis.items():
-                    if hasattr(lead.tech_stack, key):
-                        setattr(lead.tech_stack, key, value)
-                lead.tech_stack.analyzed_at = datetime.utcnow()
-            else:
-                tech_stack = TechStack(lead_id=lead.id, **analysis)
-                db.add(tech_stack)
+        for next_done in asyncio.as_completed([run(analyzer, lead) for lead in to_analyze]):
+            lead, analysis, error = await next_done
 
-            lead.opportunity_score = calculate_opportunity_score(analysis)
-            lead.is_analyzed = True
-            lead.analyzed_at = datetime.utcnow()
+            if error:
+                results["failed"] += 1
+                results["errors"].append(f"Lead {lead.id}: {str(error)}")
+                continue
 
+            if analysis.get("skipped"):
+                # Host in backoff: keep the stored analysis and score
+                results["skipped"] += 1
+                results["errors"].append(f"Lead {lead.id}: {analysis['detection_details']['error']}")
+                continue
+
+            _apply_analysis(db, lead, analysis)
             results["success"] += 1
+            if analysis.get("unchanged"):
+                results["unchanged"] += 1
+            pending_commit += 1
 
-        except Exception as e:
-            results["failed"] += 1
-            results["errors"].append(f"Lead {lead_id}: {str(e)}")
+            if pending_commit >= settings.analyzer_batch_commit_size:
+                await db.commit()
+                pending_commit = 0
 
     await db.commit()
     return results
 
 
+@router.get("/analyze/cache/stats")
+async def get_analysis_cache_stats():
+    """Get website analysis, contact validation and host health counters"""
+    from src.analyzers.cache import get_analysis_cache
+    from src.analyzers.host_health import get_host_health
+    from src.validators.contact import ContactValidator
+
+    cache = get_analysis_cache()
+    stats = {"enabled": True, **cache.stats()} if cache else {"enabled": False}
+    stats["contact_validation"] = ContactValidator.cache_stats()
+    host_health = get_host_health()
+    if host_health:
+        stats["host_health"] = host_health.stats()
+    return stats
+
+
+def _page_validators(lead: Lead) -> Optional[dict]:
+    """Validators of the lead's last successful analysis, if any"""
+    from src.analyzers.tech_stack import VALIDATOR_FIELDS
+
+    tech_stack = lead.tech_stack
+    if not tech_stack or not tech_stack.has_website:
+        return None
+    return {key: getattr(tech_stack, key) for key in VALIDATOR_FIELDS}
+
+
+def _apply_analysis(db: AsyncSession, lead: Lead, analysis: dict) -> None:
+    """Store an analysis result on a lead and recalculate its score"""
+    from src.analyzers.scoring import calculate_opportunity_score
+    from src.analyzers.tech_stack import VALIDATOR_FIELDS
+
+    analysis = dict(analysis)
+    contacts = analysis.pop("contacts", None)
+    if analysis.pop("unchanged", False) and lead.tech_stack:
+        # Same page as last time: keep the detections and score
+        for key in VALIDATOR_FIELDS:
+            setattr(lead.tech_stack, key, analysis[key])
+        lead.tech_stack.analyzed_at = datetime.utcnow()
+        lead.analyzed_at = datetime.utcnow()
+        return
+
+    if contacts:
+        _apply_contacts(lead, contacts)
+        analysis["detection_details"] = {
+            **(analysis.get("detection_details") or {}),
+            "emails": contacts["emails"],
+            "phones": contacts["phones"],
+        }
+
+    # Update or create tech_stack
+    if lead.tech_stack:
+        for key, value in analysis.items():
+            if hasattr(lead.tech_stack, key):
+                setattr(lead.tech_stack, key, value)
+        lead.tech_stack.analyzed_at = datetime.utcnow()
+    else:
+        tech_stack = TechStack(lead_id=lead.id, **analysis)
+        db.add(tech_stack)
+
+    lead.opportunity_score = calculate_opportunity_score(analysis)
+    lead.is_analyzed = True
+    lead.analyzed_at = datetime.utcnow()
+
+
+def _apply_contacts(lead: Lead, contacts: dict) -> None:
+    """Fill the lead's empty contact fields from its website"""
+    if not lead.email and contacts.get("primary_email"):
+        lead.email = contacts["primary_email"]
+    if not lead.whatsapp and contacts.get("whatsapp"):
+        lead.whatsapp = contacts["whatsapp"]
+    if not lead.phone and contacts.get("primary_phone"):
+        lead.phone = contacts["primary_phone"]
+
+
 @router.post("/export/ghl", response_model=GHLExportResponse)
 async def export_to_ghl(
     request: GHLExportRequest,
@@ -1,98 +1,18 @@
+import asyncio
 from typing import List
-from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db
 from src.api.schemas import ScrapingRequest, ScrapingJobResponse
-from src.models import Lead, ScrapingJob
-from src.scrapers import SerpApiMapsScraper, get_available_cities, REAL_ESTATE_KEYWORDS
+from src.models import ScrapingJob
+from src.scrapers import get_available_cities, REAL_ESTATE_KEYWORDS
+from src.workers.scraping import process_job
 
 router = APIRouter(prefix="/scraping", tags=["scraping"])
 
 
-async def run_scraping_job(
-    job_id: int,
-    city: str,
-    keywords: List[str],
-    limit_per_keyword: int,
-    db_url: str,
-):
-    """Background task to run scraping"""
-    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-
-    engine = create_async_engine(db_url)
-    AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with AsyncSessionLocal() as db:
-        try:
-            # Update job status to running
-            job = await db.get(ScrapingJob, job_id)
-            if not job:
-                return
-
-            job.status = "running"
-            job.started_at = datetime.utcnow()
-            await db.commit()
-
-            # Run scraper
-            scraper = SerpApiMapsScraper()
-            leads_count = 0
-
-            for keyword in keywords:
-                try:
-                    results = await scraper.search(keyword, city, limit=limit_per_keyword)
-
-                    for result in results:
-                        # Check if lead already exists
-                        place_id = result.get("place_id")
-                        if place_id:
-                            existing = await db.execute(
-                                select(Lead).where(Lead.place_id == place_id)
-                            )
-                            if existing.scalar_one_or_none():
-                                continue
-
-                        # Create new lead
-                        lead = Lead(
-                            name=result.get("name", ""),
-                            address=result.get("address"),
-                            city=result.get("city", city),
-                            province=result.get("province"),
-                            phone=result.get("phone"),
-                            website=result.get("website"),
-                            gmb_url=result.get("gmb_url"),
-                            place_id=result.get("place_id"),
-                            rating=result.get("rating"),
-                            reviews_count=result.get("reviews_count"),
-                            photos_count=result.get("photos_count"),
-                        )
-                        db.add(lead)
-                        leads_count += 1
-
-                    job.keyword = keyword  # Track last keyword processed
-                    await db.commit()
-
-                except Exception as e:
-                    print(f"Error scraping keyword '{keyword}': {e}")
-                    continue
-
-            # Update job as completed
-            job.status = "completed"
-            job.leads_found = leads_count
-            job.completed_at = datetime.utcnow()
-            await db.commit()
-
-        except Exception as e:
-            job = await db.get(ScrapingJob, job_id)
-            if job:
-                job.status = "failed"
-                job.error_message = str(e)
-                job.completed_at = datetime.utcnow()
-                await db.commit()
-
-
 @router.post("/start", response_model=ScrapingJobResponse)
 async def start_scraping(
     request: ScrapingRequest,
@@ -114,24 +34,22 @@ async def start_scraping(
 
     keywords = request.keywords or REAL_ESTATE_KEYWORDS
 
-    # Create scraping job record
+    # Create scraping job record, queued for a worker to claim
     job = ScrapingJob(
         keyword=keywords[0],  # Will be updated as we process
         city=request.city,
+        keywords=keywords,
+        limit_per_keyword=request.limit_per_keyword,
+        tiled=request.tiled,
+        rescrape=request.rescrape,
     )
     db.add(job)
     await db.commit()
     await db.refresh(job)
 
-    # Start background task
-    background_tasks.add_task(
-        run_scraping_job,
-        job.id,
-        request.city,
-        keywords,
-        request.limit_per_keyword,
-        settings.database_url,
-    )
+    # Without a worker process, run the job inside the API
+    if not settings.scraping_use_worker:
+        background_tasks.add_task(process_job, "api", job.id)
 
     return ScrapingJobResponse.model_validate(job)
 
@@ -159,12 +77,53 @@ async def get_scraping_job(
     return ScrapingJobResponse.model_validate(job)
 
 
+@router.post("/jobs/{job_id}/retry", response_model=ScrapingJobResponse)
+async def retry_scraping_job(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-queue a failed job; units it already completed are skipped"""
+    from src.config import get_settings
+
+    settings = get_settings()
+
+    job = await db.get(ScrapingJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scraping job not found")
+    if job.status != "failed":
+        raise HTTPException(status_code=400, detail="Only failed jobs can be retried")
+
+    job.status = "pending"
+    job.attempts = 0
+    job.error_message = None
+    job.completed_at = None
+    await db.commit()
+    await db.refresh(job)
+
+    if not settings.scraping_use_worker:
+        background_tasks.add_task(process_job, "api", job.id)
+
+    return ScrapingJobResponse.model_validate(job)
+
+
 @router.get("/cities")
 async def list_available_cities():
     """List available Argentine cities for scraping"""
     return {"cities": get_available_cities()}
 
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Get SerpAPI response cache hit/miss counters"""
+    from src.scrapers.cache import get_serpapi_cache
+
+    cache = get_serpapi_cache()
+    if not cache:
+        return {"enabled": False}
+    return {"enabled": True, **await asyncio.to_thread(cache.stats)}
+
+
 @router.get("/keywords")
 async def list_keywords():
     """List default real estate keywords"""
@@ -80,7 +80,9 @@ class LeadListResponse(BaseModel):
 class ScrapingRequest(BaseModel):
     city: str
     keywords: Optional[List[str]] = None
-    limit_per_keyword: int = Field(default=20, ge=1, le=100)
+    limit_per_keyword: int = Field(default=20, ge=1, le=120)
+    tiled: bool = False
+    rescrape: bool = False
 
 
 class ScrapingJobResponse(BaseModel):
@@ -91,6 +93,14 @@ class ScrapingJobResponse(BaseModel):
     status: str
     leads_found: int
     error_message: Optional[str] = None
+    units_total: int = 0
+    units_done: int = 0
+    progress: float = 0.0
+    rescrape: bool = False
+    change_summary: Optional[dict] = None
+    attempts: int = 0
+    locked_by: Optional[str] = None
+    heartbeat_at: Optional[datetime] = None
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from src.config import get_settings
@@ -8,6 +10,10 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -29,6 +35,22 @@ async def get_db():
             await session.close()
 
 
+@asynccontextmanager
+async def job_session() -> AsyncIterator[AsyncSession]:
+    """
+    Session for background jobs and workers.
+
+    Draws from the application's engine, so every job shares one
+    bounded connection pool instead of opening its own.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def dispose_engine():
+    await engine.dispose()
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
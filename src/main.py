@@ -2,7 +2,8 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.database import init_db
+from src.database import init_db, dispose_engine
+from src.analyzers.process_pool import shutdown_analysis_executor
 from src.api.routes import leads, scraping, stats
 
 
@@ -12,7 +13,8 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     # Shutdown
-    pass
+    await dispose_engine()
+    shutdown_analysis_executor()
 
 
 app = FastAPI(
@@ -1,3 +1,3 @@
-from src.models.lead import Lead, TechStack, ScrapingJob
+from src.models.lead import Lead, TechStack, ScrapingJob, ScrapingJobUnit
 
-__all__ = ["Lead", "TechStack", "ScrapingJob"]
+__all__ = ["Lead", "TechStack", "ScrapingJob", "ScrapingJobUnit"]
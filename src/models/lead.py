@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON
+from typing import Optional, List
+from sqlalchemy import String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database import Base
 
@@ -80,6 +80,11 @@ class TechStack(Base):
     # Raw detection data
     detection_details: Mapped[Optional[dict]] = mapped_column(JSON)
 
+    # Cache validators of the analyzed page, for conditional re-analysis
+    etag: Mapped[Optional[str]] = mapped_column(String(255))
+    last_modified: Mapped[Optional[str]] = mapped_column(String(100))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))  # sha256 of the body
+
     # Timestamps
     analyzed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
@@ -96,13 +101,58 @@ class ScrapingJob(Base):
     keyword: Mapped[str] = mapped_column(String(100))
     city: Mapped[str] = mapped_column(String(100))
     province: Mapped[Optional[str]] = mapped_column(String(100))
+    keywords: Mapped[Optional[list]] = mapped_column(JSON)
+    limit_per_keyword: Mapped[int] = mapped_column(Integer, default=20)
+    tiled: Mapped[bool] = mapped_column(Boolean, default=False)
+    rescrape: Mapped[bool] = mapped_column(Boolean, default=False)  # Refresh metrics of existing leads
 
     # Status
-    status: Mapped[str] = mapped_column(String(20), default="pending")  # pending, running, completed, failed
+    status: Mapped[str] = mapped_column(String(20), default="pending", index=True)  # pending, running, completed, failed
     leads_found: Mapped[int] = mapped_column(Integer, default=0)
     error_message: Mapped[Optional[str]] = mapped_column(Text)
 
+    # Progress, counted in ScrapingJobUnit rows
+    units_total: Mapped[int] = mapped_column(Integer, default=0)
+    units_done: Mapped[int] = mapped_column(Integer, default=0)
+    change_summary: Mapped[Optional[dict]] = mapped_column(JSON)  # Rescrape jobs only
+
+    # Queue lease (see src.workers.queue)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(100))
+    locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    # Relationships
+    units: Mapped[List["ScrapingJobUnit"]] = relationship(back_populates="job", cascade="all, delete-orphan")
+
+    @property
+    def progress(self) -> float:
+        """Percentage of work units finished"""
+        if not self.units_total:
+            return 100.0 if self.status == "completed" else 0.0
+        return round(100.0 * (self.units_done or 0) / self.units_total, 1)
+
+
+class ScrapingJobUnit(Base):
+    """One resumable piece of a scraping job: a results page or a map tile for a keyword"""
+
+    __tablename__ = "scraping_job_units"
+    __table_args__ = (UniqueConstraint("job_id", "keyword", "unit"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("scraping_jobs.id", ondelete="CASCADE"), index=True)
+
+    keyword: Mapped[str] = mapped_column(String(100))
+    unit: Mapped[str] = mapped_column(String(50))  # "page:<n>" or "tile:<grid>:<index>"
+
+    status: Mapped[str] = mapped_column(String(20), default="pending")  # pending, completed, skipped
+    leads_found: Mapped[int] = mapped_column(Integer, default=0)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    # Relationships
+    job: Mapped["ScrapingJob"] = relationship(back_populates="units")
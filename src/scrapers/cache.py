@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from src.config import get_settings
+
+# Params that do not change the response and must not end up in cache keys
+IGNORED_PARAMS = {"api_key", "output", "async", "no_cache"}
+
+# Expired and least recently used entries are pruned once every this many writes
+PRUNE_EVERY = 50
+
+
+def make_cache_key(params: Dict[str, Any]) -> str:
+    """
+    Build a canonical hash for a set of SerpAPI params
+
+    Keys are sorted and values stringified, so the same search always
+    maps to the same key regardless of dict order or int/str values.
+    """
+    canonical = {
+        str(k): str(v).strip()
+        for k, v in params.items()
+        if k not in IGNORED_PARAMS and v is not None
+    }
+    payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SerpApiCache:
+    """
+    SQLite-backed response cache with TTL and least-recently-used eviction.
+
+    Lookups only read: access times are kept in memory and written in
+    batches with the next prune, which runs every PRUNE_EVERY writes, so
+    the table can briefly hold a few entries over max_entries. Calls
+    block on disk; async code should run them in a thread.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 86400, max_entries: int = 10000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._accessed: Dict[str, float] = {}
+        self._writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS serpapi_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_serpapi_cache_accessed_at ON serpapi_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for params, or None if missing/expired"""
+        key = make_cache_key(params)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM serpapi_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            # Expired rows are left for the next prune
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self._accessed[key] = now
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, params: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store a response and evict the least recently used entries over the limit"""
+        # Never cache failed searches
+        if response.get("error"):
+            return
+
+        key = make_cache_key(params)
+        now = time.time()
+        payload = json.dumps(response, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO serpapi_cache (key, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+            self._accessed.pop(key, None)
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                self._prune(now)
+            self._conn.commit()
+
+    def _prune(self, now: float) -> None:
+        """Write pending access times, then drop expired and least recently used entries"""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE serpapi_cache SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+        self._conn.execute(
+            "DELETE FROM serpapi_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        self._conn.execute(
+            """
+            DELETE FROM serpapi_cache WHERE key IN (
+                SELECT key FROM serpapi_cache
+                ORDER BY accessed_at DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM serpapi_cache")
+            self._conn.commit()
+            self._accessed.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM serpapi_cache").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+@lru_cache()
+def get_serpapi_cache() -> Optional[SerpApiCache]:
+    """Return the process-wide SerpAPI cache, or None if disabled"""
+    settings = get_settings()
+    if not settings.serpapi_cache_enabled:
+        return None
+    return SerpApiCache(
+        settings.serpapi_cache_path,
+        ttl_seconds=settings.serpapi_cache_ttl_seconds,
+        max_entries=settings.serpapi_cache_max_entries,
+    )
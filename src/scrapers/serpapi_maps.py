@@ -1,7 +1,13 @@
 import asyncio
-from typing import List, Dict, Any, Optional
-from serpapi import GoogleSearch
+import random
+from contextlib import aclosing
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+from urllib.parse import urlparse, parse_qs
+import httpx
 from src.scrapers.base import BaseScraper
+from src.scrapers.rate_limit import AsyncRateLimiter
+from src.scrapers.cache import get_serpapi_cache
+from src.scrapers.tiling import Tile, plan_tiles
 from src.config import get_settings
 
 settings = get_settings()
@@ -46,14 +52,70 @@ REAL_ESTATE_KEYWORDS = [
 ]
 
 
+# Statuses worth retrying: rate limited or transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# The one SerpAPI "error" that is a valid, empty answer
+NO_RESULTS_ERROR = "hasn't returned any results"
+
+
 class SerpApiMapsScraper(BaseScraper):
     """Scraper using SerpAPI for Google Maps local results"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    BASE_URL = "https://serpapi.com/search.json"
+    PAGE_SIZE = 20  # Results per Google Maps page
+    MAX_PAGES = 6   # SerpAPI serves offsets up to start=100
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+    ):
         self.api_key = api_key or settings.serpapi_key
         if not self.api_key:
             raise ValueError("SERPAPI_KEY is required")
 
+        # Shared by every search issued through this scraper instance
+        self.max_concurrency = max_concurrency or settings.serpapi_max_concurrency
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.rate_limiter = AsyncRateLimiter(
+            requests_per_second if requests_per_second is not None
+            else settings.serpapi_requests_per_second
+        )
+        self.cache = get_serpapi_cache() if use_cache else None
+        # Always query SerpAPI, but still store the fresh responses
+        self.refresh_cache = refresh_cache
+        self.max_retries = settings.serpapi_max_retries
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "SerpApiMapsScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.serpapi_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=60.0,
+                ),
+            )
+        return self._client
+
     async def search(
         self,
         keyword: str,
@@ -64,6 +126,9 @@ class SerpApiMapsScraper(BaseScraper):
         """
         Search for real estate businesses in a city using SerpAPI
 
+        Follows pagination until `limit` results are collected, so only
+        the pages that are actually needed are requested.
+
         Args:
             keyword: Search term (e.g., "inmobiliaria")
             city: City name in Argentina
@@ -72,13 +137,119 @@ class SerpApiMapsScraper(BaseScraper):
         Returns:
             List of parsed business results
         """
+        parsed_results = []
+        max_pages = -(-limit // self.PAGE_SIZE)
+
+        async with aclosing(self.iter_pages(keyword, city, max_pages=max_pages, **kwargs)) as pages:
+            async for page in pages:
+                parsed_results.extend(page)
+                if len(parsed_results) >= limit:
+                    break
+
+        return parsed_results[:limit]
+
+    async def iter_pages(
+        self,
+        keyword: str,
+        city: str,
+        max_pages: Optional[int] = None,
+        ll: Optional[str] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream parsed Google Maps results one page at a time
+
+        Follows SerpAPI's `start` offset / `serpapi_pagination` and stops
+        early when a page adds no new place_ids.
+
+        Args:
+            keyword: Search term (e.g., "inmobiliaria")
+            city: City name in Argentina
+            max_pages: Max pages to request (defaults to MAX_PAGES)
+            ll: Map viewport override ("@lat,lng,zoomz")
+
+        Yields:
+            Lists of parsed business results, one per page
+        """
+        seen_place_ids = set()
+        start = 0
+
+        for page_index in range(min(max_pages or self.MAX_PAGES, self.MAX_PAGES)):
+            results, next_start = await self.fetch_page(keyword, city, page_index, ll=ll, start=start)
+            page = []
+
+            for result in results:
+                place_id = result.get("place_id")
+                if place_id:
+                    if place_id in seen_place_ids:
+                        continue
+                    seen_place_ids.add(place_id)
+                page.append(result)
+
+            if not page:
+                return
+
+            yield page
+
+            if next_start is None:
+                return
+            start = next_start
+
+    async def fetch_page(
+        self,
+        keyword: str,
+        city: str,
+        page_index: int = 0,
+        ll: Optional[str] = None,
+        start: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Fetch a single page of Google Maps results
+
+        SerpAPI errors other than "no results" (out of searches, invalid
+        key, ...) raise RuntimeError, so callers don't take them for an
+        empty page.
+
+        Args:
+            keyword: Search term (e.g., "inmobiliaria")
+            city: City name in Argentina
+            page_index: Zero-based page number
+            ll: Map viewport override ("@lat,lng,zoomz")
+            start: Offset from the previous page's serpapi_pagination;
+                defaults to page_index * PAGE_SIZE
+
+        Returns:
+            Tuple of (parsed results, next page's start offset or None
+            if SerpAPI reports no next page)
+        """
         city_data = ARGENTINA_CITIES.get(city)
-        if city_data:
-            query = f"{keyword} {city} Argentina"
+        params = self._build_params(keyword, city, ll)
+        if start is None:
+            start = page_index * self.PAGE_SIZE
+        if start:
+            params["start"] = start
+
+        response = await self._fetch(params)
+        if response.get("error"):
+            if NO_RESULTS_ERROR in response["error"]:
+                return [], None
+            raise RuntimeError(f"SerpAPI error for '{keyword}' in {city}: {response['error']}")
+
+        local_results = response.get("local_results", [])
+        parsed_results = []
+        for result in local_results:
+            parsed = self.parse_result(result)
+            parsed["city"] = city
+            parsed["province"] = city_data["province"] if city_data else None
+            parsed_results.append(parsed)
+
+        return parsed_results, self._next_start(response, start + len(local_results))
+
+    def _build_params(self, keyword: str, city: str, ll: Optional[str] = None) -> Dict[str, Any]:
+        """Build SerpAPI params for a keyword search in a city"""
+        city_data = ARGENTINA_CITIES.get(city)
+        query = f"{keyword} {city} Argentina"
+        if ll is None and city_data:
             ll = f"@{city_data['lat']},{city_data['lng']},14z"
-        else:
-            query = f"{keyword} {city} Argentina"
-            ll = None
 
         params = {
             "engine": "google_maps",
@@ -92,25 +263,88 @@ class SerpApiMapsScraper(BaseScraper):
         if ll:
             params["ll"] = ll
 
-        # Run sync API call in executor to not block
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(None, self._search_sync, params)
+        return params
 
-        parsed_results = []
-        local_results = results.get("local_results", [])
+    @staticmethod
+    def _next_start(response: Dict[str, Any], fallback: int) -> Optional[int]:
+        """Read the next page offset from serpapi_pagination, if there is one"""
+        next_url = response.get("serpapi_pagination", {}).get("next")
+        if not next_url:
+            return None
 
-        for idx, result in enumerate(local_results[:limit]):
-            parsed = self.parse_result(result)
-            parsed["city"] = city
-            parsed["province"] = city_data["province"] if city_data else None
-            parsed_results.append(parsed)
+        start = parse_qs(urlparse(next_url).query).get("start")
+        if start:
+            try:
+                return int(start[0])
+            except ValueError:
+                pass
+        return fallback
+
+    async def _fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the SerpAPI response for params, from cache when possible"""
+        # SQLite calls run in a thread so they don't block the event loop
+        if self.cache and not self.refresh_cache:
+            results = await asyncio.to_thread(self.cache.get, params)
+            if results is not None:
+                return results
+
+        async with self._semaphore:
+            await self.rate_limiter.acquire()
+            results = await self._request(params)
+
+        if self.cache:
+            await asyncio.to_thread(self.cache.set, params, results)
+        return results
+
+    async def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call SerpAPI, retrying with exponential backoff on 429/5xx
+
+        Raises RuntimeError if still rate limited or failing once the
+        retries are used up.
+
+        Args:
+            params: SerpAPI query params, including api_key
+
+        Returns:
+            Decoded JSON response
+        """
+        client = self._get_client()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await client.get(self.BASE_URL, params=params)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
 
-        return parsed_results
+            if response.status_code in RETRY_STATUS_CODES:
+                if attempt >= self.max_retries:
+                    # Not raise_for_status(): its message has the api_key in the URL
+                    raise RuntimeError(f"SerpAPI returned {response.status_code} after {attempt + 1} attempts")
+                await asyncio.sleep(self._backoff(attempt, response.headers.get("Retry-After")))
+                continue
+
+            # SerpAPI reports most failures as JSON with an "error" key
+            try:
+                return response.json()
+            except ValueError:
+                response.raise_for_status()
+                raise
 
-    def _search_sync(self, params: Dict) -> Dict:
-        """Synchronous search call"""
-        search = GoogleSearch(params)
-        return search.get_dict()
+        raise RuntimeError("SerpAPI retries exhausted")
+
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next retry"""
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(30.0, 2 ** attempt) + random.uniform(0, 0.5)
 
     def parse_result(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse SerpAPI Google Maps result into standardized format"""
@@ -130,11 +364,136 @@ class SerpApiMapsScraper(BaseScraper):
             "thumbnail": raw_data.get("thumbnail"),
         }
 
+    async def iter_keyword_results(
+        self,
+        city: str,
+        keywords: Optional[List[str]] = None,
+        limit_per_keyword: int = 20,
+        tiled: bool = False,
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Run all keyword searches for a city concurrently
+
+        Searches are bounded by the scraper's concurrency limit and rate
+        limiter. Failed keywords are logged and skipped.
+
+        Args:
+            city: City to search in
+            keywords: List of search terms (defaults to REAL_ESTATE_KEYWORDS)
+            limit_per_keyword: Max results per keyword (per tile when tiled)
+            tiled: Cover the city with a grid of viewports (see search_tiled)
+
+        Yields:
+            (keyword, results) tuples in completion order
+        """
+        keywords = keywords or REAL_ESTATE_KEYWORDS
+
+        async def run(keyword: str) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+            try:
+                if tiled:
+                    return keyword, await self.search_tiled(keyword, city, limit_per_tile=limit_per_keyword)
+                return keyword, await self.search(keyword, city, limit=limit_per_keyword)
+            except Exception as e:
+                print(f"Error searching '{keyword}' in {city}: {e}")
+                return keyword, None
+
+        tasks = [asyncio.create_task(run(keyword)) for keyword in keywords]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                keyword, results = await next_done
+                if results is not None:
+                    yield keyword, results
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def search_tiled(
+        self,
+        keyword: str,
+        city: str,
+        grid_size: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        limit_per_tile: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search a city as a grid of zoomed-in viewports
+
+        Tiles run in parallel under the scraper's concurrency limit and
+        results are merged by place_id. A tile that comes back saturated
+        (a full set of results) is split into four and searched again,
+        up to max_depth levels, so credits go where listings are dense.
+
+        Args:
+            keyword: Search term (e.g., "inmobiliaria")
+            city: City name, must be in ARGENTINA_CITIES
+            grid_size: Rows/columns of the initial grid
+            max_depth: Max times a saturated tile is subdivided
+            limit_per_tile: Max results requested per tile
+
+        Returns:
+            Deduplicated list of businesses
+        """
+        city_data = ARGENTINA_CITIES.get(city)
+        if not city_data:
+            return await self.search(keyword, city, limit=limit_per_tile)
+
+        tiles = plan_tiles(city, city_data, grid_size or settings.scraping_tile_grid_size)
+        tile_results = await asyncio.gather(*[
+            self.search_tile(keyword, city, tile, max_depth=max_depth, limit_per_tile=limit_per_tile)
+            for tile in tiles
+        ], return_exceptions=True)
+
+        all_results: Dict[str, Dict[str, Any]] = {}
+        for tile, results in zip(tiles, tile_results):
+            if isinstance(results, Exception):
+                print(f"Error searching '{keyword}' in {city} tile {tile.ll}: {results}")
+                continue
+            self._merge_results(all_results, results)
+        return list(all_results.values())
+
+    async def search_tile(
+        self,
+        keyword: str,
+        city: str,
+        tile: Tile,
+        max_depth: Optional[int] = None,
+        limit_per_tile: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search one tile, subdividing it while it comes back saturated
+
+        A failed search of the tile or any sub-tile is raised, so a partly
+        searched tile isn't taken as complete.
+
+        Args:
+            keyword: Search term (e.g., "inmobiliaria")
+            city: City name
+            tile: Viewport to search
+            max_depth: Max subdivision depth
+            limit_per_tile: Max results requested per tile
+
+        Returns:
+            Deduplicated list of businesses found in the tile
+        """
+        max_depth = settings.scraping_tile_max_depth if max_depth is None else max_depth
+        all_results: Dict[str, Dict[str, Any]] = {}
+
+        async def search_one(current: Tile) -> None:
+            results = await self.search(keyword, city, limit=limit_per_tile, ll=current.ll)
+            self._merge_results(all_results, results)
+
+            if len(results) >= limit_per_tile and current.depth < max_depth:
+                await asyncio.gather(*[search_one(sub) for sub in current.subdivide()])
+
+        await search_one(tile)
+        return list(all_results.values())
+
     async def search_all_keywords(
         self,
         city: str,
         keywords: Optional[List[str]] = None,
         limit_per_keyword: int = 20,
+        concurrent: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Search with all real estate keywords and deduplicate by place_id
@@ -143,6 +502,7 @@ class SerpApiMapsScraper(BaseScraper):
             city: City to search in
             keywords: List of search terms (defaults to REAL_ESTATE_KEYWORDS)
             limit_per_keyword: Max results per keyword
+            concurrent: Run the keyword searches at the same time
 
         Returns:
             Deduplicated list of businesses
@@ -150,19 +510,53 @@ class SerpApiMapsScraper(BaseScraper):
         keywords = keywords or REAL_ESTATE_KEYWORDS
         all_results = {}
 
+        if concurrent:
+            async for _, results in self.iter_keyword_results(city, keywords, limit_per_keyword):
+                self._merge_results(all_results, results)
+            return list(all_results.values())
+
         for keyword in keywords:
             try:
                 results = await self.search(keyword, city, limit=limit_per_keyword)
-                for result in results:
-                    place_id = result.get("place_id")
-                    if place_id and place_id not in all_results:
-                        all_results[place_id] = result
+                self._merge_results(all_results, results)
             except Exception as e:
                 print(f"Error searching '{keyword}' in {city}: {e}")
                 continue
 
         return list(all_results.values())
 
+    async def search_cities(
+        self,
+        cities: Optional[List[str]] = None,
+        keywords: Optional[List[str]] = None,
+        limit_per_keyword: int = 20,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search several cities at once, sharing one concurrency limit
+
+        Args:
+            cities: Cities to search in (defaults to all ARGENTINA_CITIES)
+            keywords: List of search terms (defaults to REAL_ESTATE_KEYWORDS)
+            limit_per_keyword: Max results per keyword
+
+        Returns:
+            Dict of city -> deduplicated list of businesses
+        """
+        cities = cities or get_available_cities()
+        results = await asyncio.gather(*[
+            self.search_all_keywords(city, keywords, limit_per_keyword)
+            for city in cities
+        ])
+        return dict(zip(cities, results))
+
+    @staticmethod
+    def _merge_results(all_results: Dict[str, Dict[str, Any]], results: List[Dict[str, Any]]) -> None:
+        """Add results not seen yet to all_results, keyed by place_id"""
+        for result in results:
+            place_id = result.get("place_id")
+            if place_id and place_id not in all_results:
+                all_results[place_id] = result
+
 
 def get_available_cities() -> List[str]:
     """Return list of available Argentine cities"""
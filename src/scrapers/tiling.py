@@ -0,0 +1,96 @@
+import math
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Approximate search radius for metros that extend well past a single viewport
+CITY_RADIUS_KM = {
+    "Buenos Aires": 30.0,
+    "CABA": 10.0,
+    "Cordoba": 15.0,
+    "Rosario": 12.0,
+    "Mendoza": 15.0,
+    "San Miguel de Tucuman": 10.0,
+    "La Plata": 10.0,
+    "Mar del Plata": 12.0,
+}
+DEFAULT_CITY_RADIUS_KM = 6.0
+
+KM_PER_DEGREE_LAT = 111.32
+
+# Width of the map viewport in 256px tiles, used to turn a span into a zoom level
+VIEWPORT_TILES = 4
+
+
+@dataclass(frozen=True)
+class Tile:
+    """A rectangular map viewport to search in"""
+
+    south: float
+    west: float
+    north: float
+    east: float
+    depth: int = 0
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.south + self.north) / 2, (self.west + self.east) / 2
+
+    @property
+    def zoom(self) -> int:
+        """Google Maps zoom level whose viewport roughly covers this tile"""
+        span = max(self.east - self.west, self.north - self.south, 1e-6)
+        return max(3, min(21, round(math.log2(360 * VIEWPORT_TILES / span))))
+
+    @property
+    def ll(self) -> str:
+        """SerpAPI `ll` param for this tile"""
+        lat, lng = self.center
+        return f"@{lat:.6f},{lng:.6f},{self.zoom}z"
+
+    def subdivide(self) -> List["Tile"]:
+        """Split into four quadrants one level deeper"""
+        lat, lng = self.center
+        depth = self.depth + 1
+        return [
+            Tile(self.south, self.west, lat, lng, depth),
+            Tile(self.south, lng, lat, self.east, depth),
+            Tile(lat, self.west, self.north, lng, depth),
+            Tile(lat, lng, self.north, self.east, depth),
+        ]
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """Return (south, west, north, east) around a point"""
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+    d_lng = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    return lat - d_lat, lng - d_lng, lat + d_lat, lng + d_lng
+
+
+def plan_tiles(city: str, city_data: dict, grid_size: int = 3) -> List[Tile]:
+    """
+    Split a city's bounding box into a grid of tiles
+
+    Args:
+        city: City name, used to look up its radius
+        city_data: Entry from ARGENTINA_CITIES with lat/lng
+        grid_size: Number of rows and columns
+
+    Returns:
+        List of grid_size * grid_size tiles
+    """
+    radius_km = CITY_RADIUS_KM.get(city, DEFAULT_CITY_RADIUS_KM)
+    south, west, north, east = bounding_box(city_data["lat"], city_data["lng"], radius_km)
+
+    lat_step = (north - south) / grid_size
+    lng_step = (east - west) / grid_size
+
+    return [
+        Tile(
+            south + row * lat_step,
+            west + col * lng_step,
+            south + (row + 1) * lat_step,
+            west + (col + 1) * lng_step,
+        )
+        for row in range(grid_size)
+        for col in range(grid_size)
+    ]
@@ -1,8 +1,10 @@
 import re
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, List
 from email_validator import validate_email, EmailNotValidError
-import httpx
-from bs4 import BeautifulSoup
+from src.config import get_settings
+
+settings = get_settings()
 
 
 class ContactValidator:
@@ -10,13 +12,37 @@ class ContactValidator:
 
     # Argentine phone patterns
     PHONE_PATTERNS = [
-        r"\+54\s*9?\s*\d{2,4}\s*\d{3,4}\s*\d{4}",  # +54 9 11 1234 5678
-        r"\(?\d{2,4}\)?\s*\d{3,4}[-\s]?\d{4}",      # (11) 1234-5678
-        r"(?:15)?\s*\d{4}[-\s]?\d{4}",              # 15 1234-5678
+        r"\+54\s{0,3}9?\s{0,3}\d{2,4}\s{0,3}\d{3,4}\s{0,3}\d{4}",  # +54 9 11 1234 5678
+        r"\(?\d{2,4}\)?\s{0,3}\d{3,4}[-\s]?\d{4}",                # (11) 1234-5678
+        r"(?:15)?\s{0,3}\d{4}[-\s]?\d{4}",                         # 15 1234-5678
     ]
 
     # Common email patterns to extract
-    EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+    # Anchored at the start of the local part and length-bounded (RFC 5321), so
+    # long runs like base64 data URIs can't make the search quadratic
+    EMAIL_PATTERN = r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,24}"
+
+    # Every kind of contact in one compiled pattern, so a page is scanned once.
+    # Each match starts at one of the few characters a contact can start at
+    # ("@" for emails, "+", "(" or a digit for numbers), which lets the
+    # regex engine skip straight to them; the branch after that character
+    # tells what was found. The phone branches are PHONE_PATTERNS split
+    # after their first character. Emails match from the "@" and get their
+    # local part in scan_html.
+    CONTACT_REGEX = re.compile(
+        r"[@+(0-9](?:"
+        r"(?<=@)(?P<email>[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,24})"
+        r"|(?<=wa\.me/\d)(?P<wa_me>\d*)"
+        r"|(?<=api\.whatsapp\.com/send\?phone=\d)(?P<wa_api>\d*)"
+        r"|(?<=(?i:href=[\"']tel:)[+(\d])(?P<tel>[^\"']*)(?=[\"'])"
+        r"|(?<=\+)54\s{0,3}9?\s{0,3}\d{2,4}\s{0,3}\d{3,4}\s{0,3}\d{4}(?P<phone_intl>)"
+        r"|(?<=\()\d{2,4}\)?\s{0,3}\d{3,4}[-\s]?\d{4}(?P<phone_area>)"
+        r"|(?<=\d)\d{1,3}\)?\s{0,3}\d{3,4}[-\s]?\d{4}(?P<phone_full>)"
+        r"|(?<=1)5\s{0,3}\d{4}[-\s]?\d{4}(?P<phone_mobile>)"
+        r"|(?<=\d)\d{3}[-\s]?\d{4}(?P<phone_local>)"
+        r")"
+    )
+    EMAIL_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
 
     # Generic emails to flag (less valuable)
     GENERIC_EMAILS = [
@@ -34,6 +60,7 @@ class ContactValidator:
     ]
 
     @staticmethod
+    @lru_cache(maxsize=settings.contact_cache_size)
     def validate_email_address(email: str) -> Tuple[bool, Optional[str]]:
         """
         Validate an email address.
@@ -58,6 +85,7 @@ class ContactValidator:
         return any(generic in email_lower for generic in cls.GENERIC_EMAILS)
 
     @staticmethod
+    @lru_cache(maxsize=settings.contact_cache_size)
     def normalize_phone(phone: str) -> str:
         """
         Normalize Argentine phone number to standard format.
@@ -101,6 +129,7 @@ class ContactValidator:
         return phone  # Return original if can't normalize
 
     @staticmethod
+    @lru_cache(maxsize=settings.contact_cache_size)
     def validate_phone(phone: str) -> Tuple[bool, Optional[str]]:
         """
         Validate an Argentine phone number.
@@ -122,19 +151,105 @@ class ContactValidator:
         normalized = ContactValidator.normalize_phone(phone)
         return True, normalized
 
+    # Memoized with lru_cache: the same footer addresses and numbers show
+    # up on every page of a site and across leads
+    CACHED_VALIDATORS = ["validate_email_address", "validate_phone", "normalize_phone"]
+
     @classmethod
-    def extract_emails_from_html(cls, html: str) -> List[str]:
+    def cache_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Return hit/miss counters and size of each validation cache"""
+        stats = {}
+        for name in cls.CACHED_VALIDATORS:
+            info = getattr(cls, name).cache_info()
+            lookups = info.hits + info.misses
+            stats[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0,
+                "size": info.currsize,
+                "max_entries": info.maxsize,
+            }
+        return stats
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Forget every memoized validation result"""
+        for name in cls.CACHED_VALIDATORS:
+            getattr(cls, name).cache_clear()
+
+    @classmethod
+    def validate_emails(cls, emails: Iterable[Optional[str]]) -> List[Optional[str]]:
         """
-        Extract all email addresses from HTML content.
+        Validate and normalize a column of email addresses.
+
+        Args:
+            emails: Raw email addresses (None for missing)
+
+        Returns:
+            Normalized email per input, None where missing or invalid
+        """
+        normalized = []
+        for email in emails:
+            if not email:
+                normalized.append(None)
+                continue
+            is_valid, value = cls.validate_email_address(email.strip().lower())
+            normalized.append(value if is_valid else None)
+        return normalized
+
+    @classmethod
+    def normalize_phones(cls, phones: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """
+        Validate and normalize a column of phone numbers.
+
+        Args:
+            phones: Raw phone numbers (None for missing)
+
+        Returns:
+            Normalized phone per input, None where missing or invalid
+        """
+        normalized = []
+        for phone in phones:
+            if not phone:
+                normalized.append(None)
+                continue
+            is_valid, value = cls.validate_phone(phone)
+            normalized.append(value if is_valid else None)
+        return normalized
+
+    @classmethod
+    def scan_html(cls, html: str) -> Dict[str, List[str]]:
+        """
+        Find every raw contact candidate in one pass over the page.
 
         Args:
             html: HTML content to search
 
         Returns:
-            List of found email addresses
+            Dict of raw matches by kind: email, phone, tel, wa_me and wa_api
         """
-        emails = re.findall(cls.EMAIL_PATTERN, html, re.IGNORECASE)
+        found = {"email": [], "phone": [], "tel": [], "wa_me": [], "wa_api": []}
+        local_chars = cls.EMAIL_LOCAL_CHARS
+
+        for match in cls.CONTACT_REGEX.finditer(html):
+            kind = match.lastgroup
+            if kind == "email":
+                # Walk back from the "@" over the local part (1-64 chars)
+                at = match.start()
+                start = at
+                while start > 0 and at - start <= 64 and html[start - 1] in local_chars:
+                    start -= 1
+                if 0 < at - start <= 64:
+                    found["email"].append(html[start:match.end()])
+            elif kind.startswith("phone"):
+                found["phone"].append(match.group(0))
+            else:
+                found[kind].append(match.group(0))
 
+        return found
+
+    @classmethod
+    def _clean_emails(cls, emails: List[str]) -> List[str]:
         # Clean and deduplicate
         valid_emails = []
         seen = set()
@@ -159,27 +274,7 @@ class ContactValidator:
         return valid_emails
 
     @classmethod
-    def extract_phones_from_html(cls, html: str) -> List[str]:
-        """
-        Extract phone numbers from HTML content.
-
-        Args:
-            html: HTML content to search
-
-        Returns:
-            List of found phone numbers
-        """
-        phones = []
-
-        for pattern in cls.PHONE_PATTERNS:
-            matches = re.findall(pattern, html)
-            phones.extend(matches)
-
-        # Also look for tel: links
-        tel_pattern = r'href=["\']tel:([^"\']+)["\']'
-        tel_matches = re.findall(tel_pattern, html, re.IGNORECASE)
-        phones.extend(tel_matches)
-
+    def _clean_phones(cls, phones: List[str]) -> List[str]:
         # Normalize and deduplicate
         normalized = []
         seen = set()
@@ -192,6 +287,41 @@ class ContactValidator:
 
         return normalized
 
+    @staticmethod
+    def _pick_whatsapp(found: Dict[str, List[str]]) -> Optional[str]:
+        # wa.me links win over API links; first one on the page
+        for kind in ("wa_me", "wa_api"):
+            if found[kind]:
+                return f"+{found[kind][0]}"
+        return None
+
+    @classmethod
+    def extract_emails_from_html(cls, html: str) -> List[str]:
+        """
+        Extract all email addresses from HTML content.
+
+        Args:
+            html: HTML content to search
+
+        Returns:
+            List of found email addresses
+        """
+        return cls._clean_emails(cls.scan_html(html)["email"])
+
+    @classmethod
+    def extract_phones_from_html(cls, html: str) -> List[str]:
+        """
+        Extract phone numbers from HTML content, tel: links first.
+
+        Args:
+            html: HTML content to search
+
+        Returns:
+            List of found phone numbers
+        """
+        found = cls.scan_html(html)
+        return cls._clean_phones(found["tel"] + found["phone"])
+
     @classmethod
     def extract_whatsapp_from_html(cls, html: str) -> Optional[str]:
         """
@@ -203,102 +333,98 @@ class ContactValidator:
         Returns:
             WhatsApp number if found
         """
-        # Look for wa.me links
-        wa_pattern = r'wa\.me/(\d+)'
-        matches = re.findall(wa_pattern, html)
+        return cls._pick_whatsapp(cls.scan_html(html))
 
-        if matches:
-            # Return first match, normalized
-            return f"+{matches[0]}"
+    @classmethod
+    def extract_from_html(cls, html: str) -> dict:
+        """
+        Extract emails, phones and WhatsApp number from one page.
 
-        # Look for WhatsApp API links
-        api_pattern = r'api\.whatsapp\.com/send\?phone=(\d+)'
-        api_matches = re.findall(api_pattern, html)
+        Args:
+            html: HTML content to search
 
-        if api_matches:
-            return f"+{api_matches[0]}"
+        Returns:
+            Dict with emails, phones, whatsapp, primary_email and primary_phone
+        """
+        found = cls.scan_html(html)
+        result = {
+            "emails": cls._clean_emails(found["email"]),
+            "phones": cls._clean_phones(found["tel"] + found["phone"]),
+            "whatsapp": cls._pick_whatsapp(found),
+            "primary_email": None,
+            "primary_phone": None,
+        }
+        cls._pick_primary(result)
+        return result
 
-        return None
+    @classmethod
+    def extract_from_batch(cls, documents: Iterable[str]) -> List[dict]:
+        """
+        Extract contacts from several pages.
+
+        Args:
+            documents: HTML of each page
+
+        Returns:
+            One extract_from_html result per page, in order
+        """
+        return [cls.extract_from_html(html) for html in documents]
+
+    @classmethod
+    def merge_contacts(cls, result: dict, other: dict) -> None:
+        """Add contacts found on another page of the same site to result"""
+        for email in other["emails"]:
+            if email not in result["emails"]:
+                result["emails"].append(email)
+
+        for phone in other["phones"]:
+            if phone not in result["phones"]:
+                result["phones"].append(phone)
+
+        # Check for WhatsApp if not found yet
+        if not result["whatsapp"]:
+            result["whatsapp"] = other["whatsapp"]
+
+        cls._pick_primary(result)
+
+    @classmethod
+    def _pick_primary(cls, result: dict) -> None:
+        if result["emails"]:
+            # Prefer non-generic emails
+            result["primary_email"] = next(
+                (email for email in result["emails"] if not cls.is_generic_email(email)),
+                result["emails"][0],
+            )
+        if result["phones"]:
+            result["primary_phone"] = result["phones"][0]
 
     @classmethod
     async def extract_contact_from_website(cls, url: str) -> dict:
         """
         Extract all contact information from a website.
 
+        Runs through TechStackAnalyzer, so the homepage is fetched once
+        (and shared with any concurrent analysis of the same site).
+
         Args:
             url: Website URL
 
         Returns:
             Dict with extracted contact info
         """
-        result = {
+        from src.analyzers.tech_stack import TechStackAnalyzer
+
+        async with TechStackAnalyzer(extract_contacts=True) as analyzer:
+            analysis = await analyzer.analyze(url)
+
+        result = analysis.get("contacts") or {
             "emails": [],
             "phones": [],
             "whatsapp": None,
             "primary_email": None,
             "primary_phone": None,
         }
-
-        try:
-            async with httpx.AsyncClient(
-                timeout=15.0,
-                follow_redirects=True,
-                verify=False,
-            ) as client:
-                response = await client.get(url)
-                html = response.text
-
-                # Extract emails
-                result["emails"] = cls.extract_emails_from_html(html)
-                if result["emails"]:
-                    # Prefer non-generic emails
-                    for email in result["emails"]:
-                        if not cls.is_generic_email(email):
-                            result["primary_email"] = email
-                            break
-                    if not result["primary_email"]:
-                        result["primary_email"] = result["emails"][0]
-
-                # Extract phones
-                result["phones"] = cls.extract_phones_from_html(html)
-                if result["phones"]:
-                    result["primary_phone"] = result["phones"][0]
-
-                # Extract WhatsApp
-                result["whatsapp"] = cls.extract_whatsapp_from_html(html)
-
-                # Also check contact page if exists
-                soup = BeautifulSoup(html, "lxml")
-                contact_links = soup.find_all("a", href=re.compile(r"contact|contacto", re.I))
-
-                for link in contact_links[:2]:  # Check max 2 contact pages
-                    try:
-                        contact_url = link["href"]
-                        if not contact_url.startswith("http"):
-                            contact_url = url.rstrip("/") + "/" + contact_url.lstrip("/")
-
-                        contact_response = await client.get(contact_url)
-                        contact_html = contact_response.text
-
-                        # Add any new emails/phones found
-                        new_emails = cls.extract_emails_from_html(contact_html)
-                        for email in new_emails:
-                            if email not in result["emails"]:
-                                result["emails"].append(email)
-
-                        new_phones = cls.extract_phones_from_html(contact_html)
-                        for phone in new_phones:
-                            if phone not in result["phones"]:
-                                result["phones"].append(phone)
-
-                        # Check for WhatsApp if not found yet
-                        if not result["whatsapp"]:
-                            result["whatsapp"] = cls.extract_whatsapp_from_html(contact_html)
-
-                    except Exception:
-                        continue
-
-        except Exception as e:
-            result["error"] = str(e)
-
+        error = analysis["detection_details"].get("error")
+        if error:
+            result["error"] = error
         return result
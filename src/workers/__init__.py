@@ -0,0 +1,3 @@
+from src.workers.queue import claim_job, heartbeat_job, release_job, reap_expired_jobs
+
+__all__ = ["claim_job", "heartbeat_job", "release_job", "reap_expired_jobs"]
@@ -0,0 +1,192 @@
+from datetime import datetime
+from typing import List, Dict, Any
+from sqlalchemy import select, update, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Lead
+
+# Scraped fields refreshed when an existing lead is upserted
+UPDATABLE_FIELDS = (
+    "name",
+    "address",
+    "phone",
+    "website",
+    "gmb_url",
+    "rating",
+    "reviews_count",
+    "photos_count",
+)
+
+# GMB metrics compared on rescrape; only fields that changed are written
+RESCRAPE_FIELDS = (
+    "rating",
+    "reviews_count",
+    "photos_count",
+    "phone",
+    "website",
+)
+
+
+def lead_row(result: Dict[str, Any], city: str) -> Dict[str, Any]:
+    """Map a parsed scraper result to Lead column values"""
+    return {
+        "name": result.get("name", ""),
+        "address": result.get("address"),
+        "city": result.get("city", city),
+        "province": result.get("province"),
+        "phone": result.get("phone"),
+        "website": result.get("website"),
+        "gmb_url": result.get("gmb_url"),
+        "place_id": result.get("place_id"),
+        "rating": result.get("rating"),
+        "reviews_count": result.get("reviews_count"),
+        "photos_count": result.get("photos_count"),
+    }
+
+
+def _dedupe_rows(results: List[Dict[str, Any]], city: str) -> List[Dict[str, Any]]:
+    """Map results to rows, keeping the first row per place_id"""
+    # Postgres rejects a statement that touches the same place_id twice
+    rows = []
+    seen = set()
+    for result in results:
+        row = lead_row(result, city)
+        place_id = row["place_id"]
+        if place_id:
+            if place_id in seen:
+                continue
+            seen.add(place_id)
+        rows.append(row)
+    return rows
+
+
+async def bulk_upsert_leads(
+    db: AsyncSession,
+    results: List[Dict[str, Any]],
+    city: str,
+    update_existing: bool = False,
+    batch_size: int = 500,
+) -> Dict[str, int]:
+    """
+    Insert scraped results with one INSERT ... ON CONFLICT (place_id) per batch.
+
+    Args:
+        db: Database session (the caller commits)
+        results: Parsed scraper results
+        city: City the results were searched in
+        update_existing: Refresh scraped fields of existing leads instead of skipping them
+        batch_size: Rows per statement
+
+    Returns:
+        Dict with inserted, updated and skipped counts
+    """
+    rows = _dedupe_rows(results, city)
+    inserted = 0
+    updated = 0
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        stmt = pg_insert(Lead).values(batch)
+
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Lead.place_id],
+                set_={
+                    **{field: stmt.excluded[field] for field in UPDATABLE_FIELDS},
+                    "updated_at": datetime.utcnow(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Lead.place_id])
+
+        # xmax is 0 only for rows created by this statement
+        stmt = stmt.returning(literal_column("xmax = 0").label("inserted"))
+        result = await db.execute(stmt)
+
+        for row in result:
+            if row.inserted:
+                inserted += 1
+            else:
+                updated += 1
+
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "skipped": len(rows) - inserted - updated,
+    }
+
+
+async def rescrape_leads(
+    db: AsyncSession,
+    results: List[Dict[str, Any]],
+    city: str,
+) -> Dict[str, Any]:
+    """
+    Refresh GMB metrics of existing leads and insert new ones.
+
+    Incoming results are compared with the stored rows. Only rows with
+    at least one changed field are written, and only their changed
+    fields, in one batched UPDATE. Empty incoming values never overwrite
+    stored data.
+
+    Args:
+        db: Database session (the caller commits)
+        results: Parsed scraper results
+        city: City the results were searched in
+
+    Returns:
+        Dict with inserted, updated and unchanged counts, plus per-field change counts
+    """
+    rows = _dedupe_rows(results, city)
+    by_place_id = {row["place_id"]: row for row in rows if row["place_id"]}
+
+    existing = {}
+    if by_place_id:
+        query = select(Lead.id, Lead.place_id, *[getattr(Lead, f) for f in RESCRAPE_FIELDS]).where(
+            Lead.place_id.in_(list(by_place_id))
+        )
+        for stored in (await db.execute(query)).mappings():
+            existing[stored["place_id"]] = stored
+
+    updates = []
+    field_changes = {field: 0 for field in RESCRAPE_FIELDS}
+    now = datetime.utcnow()
+
+    for place_id, stored in existing.items():
+        incoming = by_place_id[place_id]
+        changed = {
+            field: incoming[field]
+            for field in RESCRAPE_FIELDS
+            if incoming[field] not in (None, "") and incoming[field] != stored[field]
+        }
+        if changed:
+            for field in changed:
+                field_changes[field] += 1
+            updates.append({"id": stored["id"], "updated_at": now, **changed})
+
+    if updates:
+        await db.execute(update(Lead), updates)
+
+    new_results = [row for row in rows if row["place_id"] not in existing]
+    counts = await bulk_upsert_leads(db, new_results, city) if new_results else {"inserted": 0}
+
+    return {
+        "inserted": counts["inserted"],
+        "updated": len(updates),
+        "unchanged": len(existing) - len(updates),
+        "fields": field_changes,
+    }
+
+
+def merge_change_summary(summary: Dict[str, Any], counts: Dict[str, Any]) -> Dict[str, Any]:
+    """Add rescrape counts from one batch to a job's running summary"""
+    merged = {
+        "inserted": summary.get("inserted", 0) + counts["inserted"],
+        "updated": summary.get("updated", 0) + counts["updated"],
+        "unchanged": summary.get("unchanged", 0) + counts["unchanged"],
+        "fields": dict(summary.get("fields", {})),
+    }
+    for field, changed in counts["fields"].items():
+        merged["fields"][field] = merged["fields"].get(field, 0) + changed
+    return merged
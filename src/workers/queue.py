@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import ScrapingJob
+
+
+def _claimable(now: datetime, max_attempts: int):
+    """Pending jobs, or running jobs whose worker stopped renewing its lease"""
+    return and_(
+        ScrapingJob.attempts < max_attempts,
+        or_(
+            ScrapingJob.status == "pending",
+            and_(ScrapingJob.status == "running", ScrapingJob.locked_until < now),
+        ),
+    )
+
+
+async def claim_job(
+    db: AsyncSession,
+    worker_id: str,
+    lease_seconds: int,
+    max_attempts: int,
+    job_id: Optional[int] = None,
+) -> Optional[ScrapingJob]:
+    """
+    Claim the oldest available scraping job for a worker.
+
+    Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers never
+    claim the same row.
+
+    Args:
+        db: Database session
+        worker_id: Identifier of the claiming worker
+        lease_seconds: How long the claim is valid without a heartbeat
+        max_attempts: Jobs already tried this many times are skipped
+        job_id: Only try to claim this job
+
+    Returns:
+        The claimed job, or None if there is nothing to do
+    """
+    now = datetime.utcnow()
+    query = (
+        select(ScrapingJob)
+        .where(_claimable(now, max_attempts))
+        .order_by(ScrapingJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if job_id is not None:
+        query = query.where(ScrapingJob.id == job_id)
+
+    result = await db.execute(query)
+    job = result.scalar_one_or_none()
+
+    if not job:
+        await db.rollback()
+        return None
+
+    job.status = "running"
+    job.locked_by = worker_id
+    job.locked_until = now + timedelta(seconds=lease_seconds)
+    job.heartbeat_at = now
+    job.attempts = (job.attempts or 0) + 1
+    await db.commit()
+
+    return job
+
+
+async def heartbeat_job(
+    db: AsyncSession,
+    job_id: int,
+    worker_id: str,
+    lease_seconds: int,
+) -> bool:
+    """
+    Extend a job's lease.
+
+    Returns:
+        False if the worker no longer holds the job
+    """
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(ScrapingJob)
+        .where(
+            ScrapingJob.id == job_id,
+            ScrapingJob.locked_by == worker_id,
+            ScrapingJob.status == "running",
+        )
+        .values(locked_until=now + timedelta(seconds=lease_seconds), heartbeat_at=now)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def release_job(db: AsyncSession, job_id: int, worker_id: str) -> None:
+    """Drop a worker's lease on a job once it has finished"""
+    await db.execute(
+        update(ScrapingJob)
+        .where(ScrapingJob.id == job_id, ScrapingJob.locked_by == worker_id)
+        .values(locked_by=None, locked_until=None)
+    )
+    await db.commit()
+
+
+async def reap_expired_jobs(db: AsyncSession, max_attempts: int) -> int:
+    """
+    Fail jobs whose lease expired after their last allowed attempt.
+
+    Returns:
+        Number of jobs marked as failed
+    """
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(ScrapingJob)
+        .where(
+            ScrapingJob.status == "running",
+            ScrapingJob.locked_until < now,
+            ScrapingJob.attempts >= max_attempts,
+        )
+        .values(
+            status="failed",
+            error_message="Worker lease expired too many times",
+            completed_at=now,
+            locked_by=None,
+            locked_until=None,
+        )
+    )
+    await db.commit()
+    return result.rowcount
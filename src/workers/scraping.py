@@ -0,0 +1,360 @@
+import asyncio
+import os
+import signal
+import socket
+from datetime import datetime
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.database import job_session, dispose_engine
+from src.models import ScrapingJob, ScrapingJobUnit
+from src.scrapers import SerpApiMapsScraper, REAL_ESTATE_KEYWORDS
+from src.scrapers.serpapi_maps import ARGENTINA_CITIES
+from src.scrapers.tiling import plan_tiles
+from src.workers.queue import claim_job, heartbeat_job, release_job, reap_expired_jobs
+from src.workers.ingest import bulk_upsert_leads, rescrape_leads, merge_change_summary
+
+settings = get_settings()
+
+
+def _page_unit(page_index: int) -> str:
+    return f"page:{page_index}"
+
+
+def _tile_unit(grid_size: int, index: int) -> str:
+    return f"tile:{grid_size}:{index}"
+
+
+async def plan_job_units(
+    db: AsyncSession,
+    job: ScrapingJob,
+    keywords: List[str],
+    limit_per_keyword: int,
+    tiled: bool,
+) -> List[ScrapingJobUnit]:
+    """
+    Create the job's work units on first run and return all of them.
+
+    Each keyword is split into result pages, or into map tiles when
+    tiled. Units from an earlier attempt are reused as-is, so completed
+    ones are skipped on resume.
+    """
+    result = await db.execute(select(ScrapingJobUnit).where(ScrapingJobUnit.job_id == job.id))
+    units = list(result.scalars().all())
+    if units:
+        return units
+
+    city_data = ARGENTINA_CITIES.get(job.city)
+    if tiled and city_data:
+        grid_size = settings.scraping_tile_grid_size
+        unit_keys = [_tile_unit(grid_size, i) for i in range(grid_size * grid_size)]
+    else:
+        pages = min(-(-limit_per_keyword // SerpApiMapsScraper.PAGE_SIZE), SerpApiMapsScraper.MAX_PAGES)
+        unit_keys = [_page_unit(i) for i in range(pages)]
+
+    units = [
+        ScrapingJobUnit(job_id=job.id, keyword=keyword, unit=unit_key)
+        for keyword in keywords
+        for unit_key in unit_keys
+    ]
+    db.add_all(units)
+    job.units_total = len(units)
+    job.units_done = 0
+    await db.commit()
+
+    return units
+
+
+async def _iter_unit_results(
+    scraper: SerpApiMapsScraper,
+    city: str,
+    units: List[Tuple[int, str, str]],
+    limit_per_keyword: int,
+) -> AsyncIterator[Tuple[int, str, str, Optional[List[Dict[str, Any]]]]]:
+    """
+    Scrape pending units concurrently and yield them as they finish.
+
+    Pages of the same keyword run in order, since a page that adds no
+    new place_ids makes the remaining pages unnecessary; those are
+    yielded as "skipped". Tiles run independently.
+
+    Yields:
+        (unit_id, keyword, status, results) with status "completed",
+        "skipped" or "failed" (results is None when failed)
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run_pages(keyword: str, pages: List[Tuple[int, int]]) -> None:
+        seen_place_ids = set()
+        # Offset of the next page as reported by SerpAPI; pages that don't
+        # follow the previous one (resumed jobs) use page_index * PAGE_SIZE
+        next_start = None
+        previous_index = None
+        for position, (unit_id, page_index) in enumerate(pages):
+            start = next_start if previous_index == page_index - 1 else None
+            previous_index = page_index
+            try:
+                results, next_start = await scraper.fetch_page(keyword, city, page_index, start=start)
+            except Exception as e:
+                print(f"Error scraping '{keyword}' page {page_index} in {city}: {e}")
+                await queue.put((unit_id, keyword, "failed", None))
+                return
+
+            results = results[:max(0, limit_per_keyword - page_index * scraper.PAGE_SIZE)]
+            new_ids = {r.get("place_id") for r in results} - seen_place_ids
+            seen_place_ids.update(new_ids)
+            await queue.put((unit_id, keyword, "completed", results))
+
+            if next_start is None or not new_ids:
+                for skipped_id, _ in pages[position + 1:]:
+                    await queue.put((skipped_id, keyword, "skipped", []))
+                return
+
+    async def run_tile(unit_id: int, keyword: str, unit_key: str) -> None:
+        _, grid_size, index = unit_key.split(":")
+        tile = plan_tiles(city, ARGENTINA_CITIES[city], int(grid_size))[int(index)]
+        try:
+            results = await scraper.search_tile(keyword, city, tile, limit_per_tile=limit_per_keyword)
+        except Exception as e:
+            print(f"Error scraping '{keyword}' tile {tile.ll} in {city}: {e}")
+            await queue.put((unit_id, keyword, "failed", None))
+            return
+        await queue.put((unit_id, keyword, "completed", results))
+
+    pages_by_keyword: Dict[str, List[Tuple[int, int]]] = {}
+    runners = []
+    for unit_id, keyword, unit_key in units:
+        if unit_key.startswith("tile:"):
+            runners.append(run_tile(unit_id, keyword, unit_key))
+        else:
+            pages_by_keyword.setdefault(keyword, []).append((unit_id, int(unit_key.split(":")[1])))
+
+    for keyword, pages in pages_by_keyword.items():
+        runners.append(run_pages(keyword, sorted(pages, key=lambda p: p[1])))
+
+    async def guarded(runner) -> None:
+        try:
+            await runner
+        finally:
+            queue.put_nowait(None)  # Marks this runner as finished
+
+    tasks = [asyncio.create_task(guarded(runner)) for runner in runners]
+    finished = 0
+
+    try:
+        while finished < len(tasks):
+            item = await queue.get()
+            if item is None:
+                finished += 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def run_scraping_job(
+    job_id: int,
+    city: str,
+    keywords: List[str],
+    limit_per_keyword: int,
+    tiled: bool = False,
+    rescrape: bool = False,
+):
+    """
+    Run a scraping job and store new leads.
+
+    Progress is checkpointed per unit, so a restarted or retried job
+    only scrapes the units that are still pending. In rescrape mode,
+    changed GMB metrics of existing leads are written too and the job
+    keeps a change summary.
+    """
+    async with job_session() as db:
+        try:
+            # Update job status to running
+            job = await db.get(ScrapingJob, job_id)
+            if not job:
+                return
+
+            job.status = "running"
+            job.started_at = job.started_at or datetime.utcnow()
+            job.error_message = None
+            await db.commit()
+
+            units = await plan_job_units(db, job, keywords, limit_per_keyword, tiled)
+            pending = [(u.id, u.keyword, u.unit) for u in units if u.status == "pending"]
+            failed_units = 0
+
+            # Rescrapes must see current metrics, not the cached responses
+            # that created the leads
+            async with SerpApiMapsScraper(refresh_cache=rescrape) as scraper:
+                # Units run concurrently, results are stored as they arrive
+                async for unit_id, keyword, status, results in _iter_unit_results(
+                    scraper, city, pending, limit_per_keyword
+                ):
+                    if status == "failed":
+                        failed_units += 1
+                        continue
+
+                    try:
+                        if rescrape and results:
+                            counts = await rescrape_leads(db, results, city)
+                            job.change_summary = merge_change_summary(job.change_summary or {}, counts)
+                        elif results:
+                            counts = await bulk_upsert_leads(db, results, city)
+                        else:
+                            counts = {"inserted": 0}
+
+                        await db.execute(
+                            update(ScrapingJobUnit)
+                            .where(ScrapingJobUnit.id == unit_id)
+                            .values(
+                                status=status,
+                                leads_found=counts["inserted"],
+                                completed_at=datetime.utcnow(),
+                            )
+                        )
+                        job.leads_found = (job.leads_found or 0) + counts["inserted"]
+                        job.units_done = (job.units_done or 0) + 1
+                        job.keyword = keyword  # Track last keyword processed
+                        await db.commit()
+
+                    except Exception as e:
+                        await db.rollback()
+                        await db.refresh(job)
+                        failed_units += 1
+                        print(f"Error storing results for '{keyword}': {e}")
+
+            # Unfinished units stay pending so a retry picks them up
+            if failed_units:
+                job.status = "failed"
+                job.error_message = f"{failed_units} unit(s) failed, retry the job to resume"
+            else:
+                job.status = "completed"
+            job.completed_at = datetime.utcnow()
+            await db.commit()
+
+        except Exception as e:
+            await db.rollback()
+            job = await db.get(ScrapingJob, job_id)
+            if job:
+                job.status = "failed"
+                job.error_message = str(e)
+                job.completed_at = datetime.utcnow()
+                await db.commit()
+
+
+async def _keep_lease(job_id: int, worker_id: str, task: asyncio.Task) -> None:
+    """Renew the job lease until the job finishes; cancel it if the lease is lost"""
+    interval = max(1.0, settings.worker_lease_seconds / 3)
+
+    while not task.done():
+        await asyncio.sleep(interval)
+        try:
+            async with job_session() as db:
+                still_owned = await heartbeat_job(db, job_id, worker_id, settings.worker_lease_seconds)
+        except Exception as e:
+            print(f"Heartbeat failed for job {job_id}: {e}")
+            continue
+
+        if not still_owned:
+            print(f"Worker {worker_id} lost the lease on job {job_id}, stopping it")
+            task.cancel()
+            return
+
+
+async def process_job(worker_id: str, job_id: Optional[int] = None) -> bool:
+    """
+    Claim one scraping job and run it while keeping its lease alive.
+
+    Args:
+        worker_id: Identifier of this worker
+        job_id: Only process this job (used when running inside the API)
+
+    Returns:
+        True if a job was claimed
+    """
+    async with job_session() as db:
+        job = await claim_job(
+            db,
+            worker_id,
+            lease_seconds=settings.worker_lease_seconds,
+            max_attempts=settings.worker_max_attempts,
+            job_id=job_id,
+        )
+        if not job:
+            return False
+
+        params = (
+            job.id,
+            job.city,
+            job.keywords or REAL_ESTATE_KEYWORDS,
+            job.limit_per_keyword or 20,
+            bool(job.tiled),
+            bool(job.rescrape),
+        )
+
+    task = asyncio.create_task(run_scraping_job(*params))
+    lease = asyncio.create_task(_keep_lease(params[0], worker_id, task))
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        # Lease lost: another worker may pick the job up again
+        if not lease.done():
+            raise
+        return True
+    finally:
+        lease.cancel()
+
+    async with job_session() as db:
+        await release_job(db, params[0], worker_id)
+
+    return True
+
+
+async def run_worker(worker_id: Optional[str] = None) -> None:
+    """
+    Poll the scraping_jobs table and process jobs until stopped.
+
+    Several worker processes can run at the same time, on the same or
+    different machines.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass
+
+    print(f"Scraping worker {worker_id} started")
+
+    while not stop.is_set():
+        try:
+            async with job_session() as db:
+                reaped = await reap_expired_jobs(db, settings.worker_max_attempts)
+                if reaped:
+                    print(f"Marked {reaped} abandoned job(s) as failed")
+
+            claimed = await process_job(worker_id)
+        except Exception as e:
+            print(f"Worker error: {e}")
+            claimed = False
+
+        if not claimed:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.worker_poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    await dispose_engine()
+    print(f"Scraping worker {worker_id} stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
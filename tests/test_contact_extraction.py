@@ -0,0 +1,71 @@
+from src.validators.contact import ContactValidator
+
+
+def test_tel_link():
+    found = ContactValidator.scan_html('<a href="tel:+54 9 11 4444 5555">Llamanos</a>')
+    assert found["tel"] == ["+54 9 11 4444 5555"]
+    assert found["phone"] == []
+
+
+def test_tel_link_is_primary_phone():
+    html = '<p>Tel: (011) 4567-8901</p><a href="tel:+5491144445555">Llamanos</a>'
+    result = ContactValidator.extract_from_html(html)
+    assert result["phones"][0] == "+54 9 11 4444 5555"
+    assert result["primary_phone"] == "+54 9 11 4444 5555"
+
+
+def test_wa_me_link():
+    found = ContactValidator.scan_html('<a href="https://wa.me/5491122223333">WhatsApp</a>')
+    assert found["wa_me"] == ["5491122223333"]
+    assert found["phone"] == []
+
+
+def test_api_whatsapp_link():
+    html = '<a href="https://api.whatsapp.com/send?phone=5491133334444">Chat</a>'
+    found = ContactValidator.scan_html(html)
+    assert found["wa_api"] == ["5491133334444"]
+    assert found["phone"] == []
+
+
+def test_wa_me_wins_over_api_link():
+    html = (
+        '<a href="https://api.whatsapp.com/send?phone=5491133334444">Chat</a>'
+        '<a href="https://wa.me/5491122223333">WhatsApp</a>'
+    )
+    assert ContactValidator.extract_whatsapp_from_html(html) == "+5491122223333"
+
+
+def test_area_code_in_parentheses():
+    found = ContactValidator.scan_html("<p>Tel: (011) 4567-8901</p>")
+    assert found["phone"] == ["(011) 4567-8901"]
+
+
+def test_old_mobile_prefix():
+    found = ContactValidator.scan_html("<p>Cel: 15 1234-5678</p>")
+    assert found["phone"] == ["15 1234-5678"]
+
+
+def test_international_number():
+    found = ContactValidator.scan_html("<p>Llamá al +54 9 11 4567 8901</p>")
+    assert found["phone"] == ["+54 9 11 4567 8901"]
+
+
+def test_matches_do_not_overlap():
+    html = (
+        "<p>Tel: (011) 4567-8901 / 15 1234-5678</p>"
+        '<a href="https://wa.me/5491122223333">WhatsApp</a>'
+        "<p>info@inmobiliaria.com.ar</p>"
+    )
+    found = ContactValidator.scan_html(html)
+    # One match per number: no fragments of it, and no wa.me digits as a phone
+    assert found["phone"] == ["(011) 4567-8901", "15 1234-5678"]
+    assert found["wa_me"] == ["5491122223333"]
+    assert found["email"] == ["info@inmobiliaria.com.ar"]
+
+    spans = sorted(match.span() for match in ContactValidator.CONTACT_REGEX.finditer(html))
+    assert all(end <= start for (_, end), (start, _) in zip(spans, spans[1:]))
+
+
+def test_email_local_part():
+    found = ContactValidator.scan_html('<a href="mailto:ventas.norte@inmobiliaria.com.ar">Escribinos</a>')
+    assert found["email"] == ["ventas.norte@inmobiliaria.com.ar"]